@@ -2,29 +2,53 @@
 Attachments API - Clean, production-level file upload and management
 All file operations delegated to services.
 """
-from fastapi import APIRouter, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, HTTPException, Request, Response, status, UploadFile, File
+from fastapi.responses import FileResponse
 from typing import List
 from uuid import UUID
+from pathlib import Path
+from pydantic import TypeAdapter
+import hashlib
 import logging
+import os
 
 from app.dependencies.auth import CurrentActiveUser, SessionDep
 from app.dependencies.attachments import AttachmentServiceDep
 from app.schemas.attachment import AttachmentResponse, AttachmentWithUploader
-from app.models.user import User
-from app.models.ticket import Ticket
 from app.utils.router_helpers import ErrorHandler
+from app.utils.ticket_cache import ticket_exists
+from app.core.cache import cache_get_json, cache_set_json, cache_delete
+from app.core.config import get_settings
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/attachments", tags=["attachments"])
 
+# Compiled once at import; serializes a whole attachment batch in a
+# single pydantic-core pass instead of per-item model_validate calls
+_attachment_list_adapter = TypeAdapter(List[AttachmentWithUploader])
+
+
+def _serialize_attachment_list(attachments) -> Response:
+    """Validate and dump an attachment batch as one JSON payload.
+
+    Returning a prebuilt Response skips FastAPI's response_model
+    re-validation; the response_model on the route is kept for OpenAPI.
+    """
+    # from_attributes comes from the schema config, so ORM instances are
+    # read attribute-by-attribute instead of splatting their __dict__
+    validated = _attachment_list_adapter.validate_python(attachments)
+    return Response(
+        content=_attachment_list_adapter.dump_json(validated),
+        media_type="application/json"
+    )
+
 # ============= HELPERS =============
 
-async def _verify_ticket_exists(ticket_id: UUID, db: SessionDep) -> Ticket:
-    """Helper to verify ticket exists"""
-    ticket = await db.get(Ticket, ticket_id)
-    if not ticket:
+async def _verify_ticket_exists(ticket_id: UUID, db: SessionDep) -> None:
+    """Helper to verify ticket exists (TTL-cached for hot tickets)"""
+    if not await ticket_exists(ticket_id, db):
         raise ErrorHandler.handle_not_found("Ticket")
-    return ticket
 
 
 # ============= ENDPOINTS =============
@@ -55,7 +79,45 @@ async def upload_attachment(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to upload attachment: {str(e)}", exc_info=True)
+        logger.error("Failed to upload attachment: %s", e, exc_info=settings.debug)
+        raise ErrorHandler.handle_internal_error()
+
+
+@router.post("/tickets/{ticket_id}/upload/stream", response_model=AttachmentResponse, status_code=status.HTTP_201_CREATED)
+async def upload_attachment_stream(
+    ticket_id: UUID,
+    request: Request,
+    current_user: CurrentActiveUser,
+    service: AttachmentServiceDep,
+    db: SessionDep
+):
+    """Upload a file attachment by streaming the raw request body.
+
+    Avoids UploadFile's spooled temp-file buffering: chunks from
+    request.stream() are written directly to disk. The client sends the
+    raw bytes as the body, the MIME type in Content-Type and the original
+    filename in X-Filename.
+    """
+    try:
+        await _verify_ticket_exists(ticket_id, db)
+
+        attachment = await service.upload_attachment_stream(
+            ticket_id=ticket_id,
+            uploaded_by=current_user.id,
+            filename=request.headers.get("x-filename", ""),
+            content_type=request.headers.get("content-type", ""),
+            stream=request.stream()
+        )
+
+        return AttachmentResponse.model_validate(attachment)
+    except ValueError as e:
+        raise ErrorHandler.handle_validation_error(str(e))
+    except PermissionError as e:
+        raise ErrorHandler.handle_permission_denied(str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to stream-upload attachment: %s", e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error()
 
 
@@ -78,22 +140,14 @@ async def list_ticket_attachments(
             limit=limit
         )
         
-        # Enrich with uploader details
-        enriched = []
-        for attachment in attachments:
-            uploader = await db.get(User, attachment.uploaded_by)
-            enriched.append(AttachmentWithUploader(
-                **attachment.__dict__,
-                uploader=uploader
-            ))
-        
-        return enriched
+        # Uploader is eager-loaded by the service query
+        return _serialize_attachment_list(attachments)
     except ValueError as e:
         raise ErrorHandler.handle_validation_error(str(e))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list attachments: {str(e)}", exc_info=True)
+        logger.error("Failed to list attachments: %s", e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error()
 
 
@@ -106,49 +160,85 @@ async def get_attachment(
 ):
     """Get a specific attachment"""
     try:
+        # Attachment metadata is immutable after upload, so it caches well
+        cache_key = f"attachment:{attachment_id}"
+        cached = await cache_get_json(cache_key)
+        if cached is not None:
+            return AttachmentWithUploader.model_validate(cached)
+
         attachment = await service.get_attachment(attachment_id)
         if not attachment:
             raise ErrorHandler.handle_not_found("Attachment")
-        
-        uploader = await db.get(User, attachment.uploaded_by)
-        
-        return AttachmentWithUploader(
-            **attachment.__dict__,
-            uploader=uploader
-        )
+
+        response = AttachmentWithUploader.model_validate(attachment)
+        await cache_set_json(cache_key, response.model_dump(mode="json"))
+        return response
     except ValueError as e:
         raise ErrorHandler.handle_validation_error(str(e))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get attachment: {str(e)}", exc_info=True)
+        logger.error("Failed to get attachment: %s", e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error()
 
 
+def _file_etag(stat_result: os.stat_result) -> str:
+    """ETag for a stored file, matching FileResponse's mtime-size scheme"""
+    etag_base = str(stat_result.st_mtime) + "-" + str(stat_result.st_size)
+    return f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+
+
 @router.get("/{attachment_id}/download")
 async def download_attachment(
     attachment_id: UUID,
+    request: Request,
     current_user: CurrentActiveUser,
     service: AttachmentServiceDep
 ):
-    """Download an attachment file"""
+    """Download an attachment file.
+
+    Supports conditional requests: If-None-Match against the file's ETag
+    answers 304 without touching the file body, and Range/If-Range
+    partial downloads are handled by FileResponse itself.
+
+    With accel_redirect_enabled, the response only carries an
+    X-Accel-Redirect header and nginx serves the file from its internal
+    location, freeing the app worker immediately. Otherwise FileResponse
+    hands the file off via the ASGI pathsend extension (zero-copy
+    os.sendfile in the server) when the server supports it, and falls
+    back to chunked reads in a thread pool.
+    """
     try:
-        from fastapi.responses import FileResponse
-        from pathlib import Path
-        
         file_path = await service.get_file_path(attachment_id)
-        
+        filename = Path(file_path).name
+
+        if settings.accel_redirect_enabled:
+            # nginx handles Range/ETag itself for accel-redirected files
+            return Response(
+                headers={
+                    "X-Accel-Redirect": f"{settings.accel_redirect_prefix}/{filename}",
+                    "Content-Disposition": f'attachment; filename="{filename}"',
+                },
+                media_type="application/octet-stream"
+            )
+
+        stat_result = os.stat(file_path)
+        etag = _file_etag(stat_result)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"etag": etag})
+
         return FileResponse(
             path=file_path,
-            filename=Path(file_path).name,
-            media_type="application/octet-stream"
+            filename=filename,
+            media_type="application/octet-stream",
+            stat_result=stat_result
         )
     except ValueError as e:
         raise ErrorHandler.handle_not_found("Attachment")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to download attachment: {str(e)}", exc_info=True)
+        logger.error("Failed to download attachment: %s", e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error()
 
 
@@ -159,13 +249,16 @@ async def delete_attachment(
     service: AttachmentServiceDep,
     db: SessionDep
 ):
-    """Delete an attachment (uploader only)"""
+    """Delete an attachment (uploader or admin)"""
     try:
+        # current_user is already loaded by the auth dependency, so the
+        # admin check costs no extra query
         await service.delete_attachment(
             attachment_id=attachment_id,
             user_id=current_user.id,
-            is_admin=False
+            is_admin=current_user.role == "admin"
         )
+        await cache_delete(f"attachment:{attachment_id}")
     except ValueError as e:
         raise ErrorHandler.handle_not_found("Attachment")
     except PermissionError as e:
@@ -173,7 +266,7 @@ async def delete_attachment(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete attachment: {str(e)}", exc_info=True)
+        logger.error("Failed to delete attachment: %s", e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error()
 
 
@@ -193,15 +286,8 @@ async def list_my_attachments(
             limit=limit
         )
         
-        enriched = []
-        for attachment in attachments:
-            uploader = await db.get(User, attachment.uploaded_by)
-            enriched.append(AttachmentWithUploader(
-                **attachment.__dict__,
-                uploader=uploader
-            ))
-        
-        return enriched
+        # Uploader is eager-loaded by the service query
+        return _serialize_attachment_list(attachments)
     except Exception as e:
-        logger.error(f"Failed to list user attachments: {str(e)}", exc_info=True)
+        logger.error("Failed to list user attachments: %s", e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error()
@@ -2,7 +2,7 @@
 Authentication API - Clean production-level auth endpoints
 All auth logic delegated to AuthService.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 import logging
 
@@ -12,16 +12,31 @@ from app.models.user import User
 from app.services.auth_service import AuthService
 from app.schemas.user import UserCreate, UserLogin, UserResponse, AuthResponse
 from app.utils.router_helpers import ErrorHandler
+from app.core.config import get_settings
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def _build_auth_response(user: User, token: str) -> AuthResponse:
+    """Assemble the auth payload without re-validating known-good fields.
+
+    The user row was just validated into UserResponse and the token is a
+    string we created ourselves, so model_construct skips a second
+    Pydantic validation pass on the login/register hot path.
+    """
+    return AuthResponse.model_construct(
+        user=UserResponse.model_validate(user),
+        access_token=token,
+        token_type="bearer"
+    )
+
+
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: SessionDep,
-    background_tasks: BackgroundTasks
+    db: SessionDep
 ):
     """
     Register a new user account.
@@ -32,26 +47,21 @@ async def register(
     - **timezone**: User timezone (default: UTC)
     """
     try:
-        auth_service = AuthService(User, db, background_tasks)
+        auth_service = AuthService(User, db)
         user, token = await auth_service._add_user(user_data.model_dump())
         
-        return AuthResponse(
-            user=UserResponse.model_validate(user),
-            access_token=token,
-            token_type="bearer"
-        )
+        return _build_auth_response(user, token)
     except ValueError as e:
         raise ErrorHandler.handle_validation_error(str(e))
     except Exception as e:
-        logger.error(f"Registration error: {type(e).__name__}: {str(e)}", exc_info=True)
+        logger.error("Registration error: %s: %s", type(e).__name__, e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error("Failed to create user account")
 
 
 @router.post("/login", response_model=AuthResponse)
 async def login(
     login_data: UserLogin,
-    db: SessionDep,
-    background_tasks: BackgroundTasks
+    db: SessionDep
 ):
     """
     Login with email or username and password.
@@ -61,17 +71,13 @@ async def login(
     Returns user data and access token.
     """
     try:
-        auth_service = AuthService(User, db, background_tasks)
+        auth_service = AuthService(User, db)
         user, token = await auth_service.login_user(
             username_or_email=login_data.username_or_email,
             password=login_data.password
         )
         
-        return AuthResponse(
-            user=UserResponse.model_validate(user),
-            access_token=token,
-            token_type="bearer"
-        )
+        return _build_auth_response(user, token)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -79,14 +85,13 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"}
         )
     except Exception as e:
-        logger.error(f"Login error: {type(e).__name__}: {str(e)}", exc_info=True)
+        logger.error("Login error: %s: %s", type(e).__name__, e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error("Login failed")
 
 
 @router.post("/login/form", response_model=AuthResponse)
 async def login_with_form(
     db: SessionDep,
-    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
@@ -96,17 +101,13 @@ async def login_with_form(
     - **password**: User's password
     """
     try:
-        auth_service = AuthService(User, db, background_tasks)
+        auth_service = AuthService(User, db)
         user, token = await auth_service.login_user(
             username_or_email=form_data.username,
             password=form_data.password
         )
         
-        return AuthResponse(
-            user=UserResponse.model_validate(user),
-            access_token=token,
-            token_type="bearer"
-        )
+        return _build_auth_response(user, token)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -114,7 +115,7 @@ async def login_with_form(
             headers={"WWW-Authenticate": "Bearer"}
         )
     except Exception as e:
-        logger.error(f"Login form error: {type(e).__name__}: {str(e)}", exc_info=True)
+        logger.error("Login form error: %s: %s", type(e).__name__, e, exc_info=settings.debug)
         raise ErrorHandler.handle_internal_error("Login failed")
 
 
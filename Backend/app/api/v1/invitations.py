@@ -1,27 +1,49 @@
 from fastapi import APIRouter, HTTPException, status
-from typing import List
-from uuid import UUID
-from sqlalchemy import select
-from datetime import datetime
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import joinedload, raiseload
+from datetime import datetime, timezone
 
+from app.core.cache import cache_delete
+from app.core.config import settings
 from app.db.session import SessionDep
 from app.dependencies.auth import CurrentActiveUser
 from app.models.invitation import ProjectInvitation, InvitationStatus
 from app.models.user import User
 from app.models.project import Project, ProjectMember
 from app.schemas.project import ProjectResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 router = APIRouter(prefix="/me/invitations", tags=["Invitations"])
 
+# Status values bound once at import; the column stores the enum's value
+# as a plain string, so comparisons stay simple indexable equality
+_PENDING = InvitationStatus.PENDING.value
+_ACCEPTED = InvitationStatus.ACCEPTED.value
+_DECLINED = InvitationStatus.DECLINED.value
+_EXPIRED = InvitationStatus.EXPIRED.value
+
+
+class InvitedByBrief(BaseModel):
+    """Inviter summary embedded in invitation responses"""
+    id: UUID
+    username: str
+    full_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 
 class ProjectInvitationResponse(BaseModel):
-    id: str
+    id: UUID
     project: ProjectResponse
     role: str
     invited_by: dict
-    created_at: str
-    expires_at: str
+    created_at: Optional[datetime]
+    expires_at: Optional[datetime]
     status: str
 
     class Config:
@@ -33,47 +55,107 @@ class InvitationCreate(BaseModel):
     role: str
 
 
+# Compiled once at import for the streamed listing (see comments router)
+_invitation_adapter = TypeAdapter(ProjectInvitationResponse)
+_invited_by_adapter = TypeAdapter(InvitedByBrief)
+
+# The pending-invitations statement is built once at import with a bound
+# parameter for the user, skipping per-request Core expression-tree
+# construction; project and inviter ride along as many-to-one LEFT JOINs,
+# which (unlike collection loads) are safe to combine with streaming
+_PENDING_INVITES_STMT = (
+    select(ProjectInvitation)
+    .options(
+        joinedload(ProjectInvitation.project),
+        joinedload(ProjectInvitation.invited_by_user)
+    )
+    .where(
+        ProjectInvitation.user_id == bindparam("uid"),
+        ProjectInvitation.status == _PENDING
+    )
+)
+if settings.debug:
+    # Surface any accidental lazy access loudly in development instead
+    # of silently reintroducing N+1 queries
+    _PENDING_INVITES_STMT = _PENDING_INVITES_STMT.options(raiseload("*"))
+
+
+async def _diagnose_failed_transition(
+    db, invitation_id: UUID, user_id: UUID, verb: str
+) -> HTTPException:
+    """Explain why an accept/decline UPDATE matched no row.
+
+    The happy path mutates with a single guarded UPDATE; only when that
+    matches nothing do we spend one SELECT deciding between 404/403/400.
+    """
+    invitation = await db.get(ProjectInvitation, invitation_id)
+    if not invitation:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Invitation not found"
+        )
+    if invitation.user_id != user_id:
+        return HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"You cannot {verb} this invitation"
+        )
+    if invitation.status != _PENDING:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invitation is already {invitation.status}"
+        )
+    # Still pending but the guarded UPDATE skipped it: it has expired
+    invitation.status = _EXPIRED
+    db.add(invitation)
+    await db.commit()
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="This invitation has expired"
+    )
+
+
 @router.get("", response_model=List[ProjectInvitationResponse])
 async def get_user_invitations(
     db: SessionDep,
     current_user: CurrentActiveUser
 ):
-    """Get all pending invitations for the current user"""
-    try:
-        # Get all pending invitations for the user
-        result = await db.execute(
-            select(ProjectInvitation).where(
-                ProjectInvitation.user_id == current_user.id,
-                ProjectInvitation.status == InvitationStatus.PENDING.value
-            )
-        )
-        invitations = result.scalars().all()
-        
-        # Build response with full project and user details
-        response_data = []
-        for inv in invitations:
-            invited_by_user = await db.get(User, inv.invited_by)
-            response_data.append({
-                "id": str(inv.id),
-                "project": ProjectResponse.model_validate(inv.project),
+    """Get all pending invitations for the current user.
+
+    Rows are streamed: each invitation is serialized as it arrives from
+    the server-side cursor, so the first bytes flush before the query
+    finishes and the heap never holds the whole list.
+    """
+    async def generate():
+        yield b"["
+        first = True
+        result = await db.stream(_PENDING_INVITES_STMT, {"uid": current_user.id})
+        async for inv in result.scalars():
+            if not first:
+                yield b","
+            invited_by_user = inv.invited_by_user
+            payload = {
+                "id": inv.id,
+                "project": inv.project,
                 "role": inv.role,
-                "invited_by": {
-                    "id": str(invited_by_user.id),
-                    "username": invited_by_user.username,
-                    "full_name": invited_by_user.full_name,
-                    "avatar_url": invited_by_user.avatar_url,
-                } if invited_by_user else {},
-                "created_at": inv.created_at.isoformat() if inv.created_at else None,
-                "expires_at": inv.expires_at.isoformat() if inv.expires_at else None,
+                # One C-level serialize call instead of four attribute
+                # reads and a str() per row
+                "invited_by": _invited_by_adapter.dump_python(
+                    _invited_by_adapter.validate_python(
+                        invited_by_user, from_attributes=True
+                    ),
+                    mode="json"
+                ) if invited_by_user else {},
+                "created_at": inv.created_at,
+                "expires_at": inv.expires_at,
                 "status": inv.status,
-            })
-        
-        return response_data
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch invitations: {str(e)}"
-        )
+            }
+            yield _invitation_adapter.dump_json(
+                _invitation_adapter.validate_python(payload)
+            )
+            first = False
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @router.post("/{invitation_id}/accept", status_code=status.HTTP_200_OK)
@@ -82,53 +164,54 @@ async def accept_invitation(
     db: SessionDep,
     current_user: CurrentActiveUser
 ):
-    """Accept a project invitation"""
-    try:
-        # Get the invitation
-        invitation = await db.get(ProjectInvitation, invitation_id)
-        if not invitation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Invitation not found"
-            )
-        
-        # Verify it's for the current user
-        if invitation.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You cannot accept this invitation"
-            )
-        
-        # Check if already processed
-        if invitation.status != InvitationStatus.PENDING.value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invitation is already {invitation.status}"
-            )
-        
-        # Add user to project as a member with the invited role
-        new_member = ProjectMember(
-            project_id=invitation.project_id,
-            user_id=current_user.id,
-            role=invitation.role
+    """Accept a project invitation.
+
+    Errors propagate to the app-level exception handlers (IntegrityError
+    -> 409 when the user is already a member, SQLAlchemyError -> logged
+    500); the session dependency rolls back on the way out.
+    """
+    # Flip PENDING -> ACCEPTED with a single guarded UPDATE. The
+    # ownership, status and expiry checks all live in the WHERE
+    # clause, so the happy path is one round-trip and two concurrent
+    # accepts cannot both pass the PENDING check.
+    result = await db.execute(
+        update(ProjectInvitation)
+        .where(
+            ProjectInvitation.id == invitation_id,
+            ProjectInvitation.user_id == current_user.id,
+            ProjectInvitation.status == _PENDING,
+            ProjectInvitation.expires_at > datetime.now(timezone.utc)
+        )
+        .values(status=_ACCEPTED)
+        .returning(ProjectInvitation.project_id, ProjectInvitation.role,
+                   ProjectInvitation.invited_by)
+    )
+    row = result.first()
+    if row is None:
+        raise await _diagnose_failed_transition(
+            db, invitation_id, current_user.id, "accept"
         )
-        db.add(new_member)
-        
-        # Update invitation status
-        invitation.status = InvitationStatus.ACCEPTED.value
-        db.add(invitation)
-        
-        await db.commit()
-        
-        return {"message": "Invitation accepted successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to accept invitation: {str(e)}"
+
+    # Add user to project as a member with the invited role, in the
+    # same transaction as the status flip. A Core INSERT skips the
+    # ORM's unit-of-work flush bookkeeping for this single row.
+    await db.execute(
+        insert(ProjectMember).values(
+            id=uuid4(),
+            project_id=row.project_id,
+            user_id=current_user.id,
+            role=row.role,
+            added_by=row.invited_by
         )
+    )
+    await db.commit()
+
+    # The member page and the user's project list both changed
+    await cache_delete(
+        f"members:{row.project_id}", f"projects:{current_user.id}"
+    )
+
+    return {"message": "Invitation accepted successfully"}
 
 
 @router.post("/{invitation_id}/decline", status_code=status.HTTP_200_OK)
@@ -138,41 +221,21 @@ async def decline_invitation(
     current_user: CurrentActiveUser
 ):
     """Decline a project invitation"""
-    try:
-        # Get the invitation
-        invitation = await db.get(ProjectInvitation, invitation_id)
-        if not invitation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Invitation not found"
-            )
-        
-        # Verify it's for the current user
-        if invitation.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You cannot decline this invitation"
-            )
-        
-        # Check if already processed
-        if invitation.status != InvitationStatus.PENDING.value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invitation is already {invitation.status}"
-            )
-        
-        # Update invitation status
-        invitation.status = InvitationStatus.DECLINED.value
-        db.add(invitation)
-        
-        await db.commit()
-        
-        return {"message": "Invitation declined successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to decline invitation: {str(e)}"
+    # Single guarded UPDATE; see accept_invitation. Declining an
+    # expired-but-still-pending invitation is allowed.
+    result = await db.execute(
+        update(ProjectInvitation)
+        .where(
+            ProjectInvitation.id == invitation_id,
+            ProjectInvitation.user_id == current_user.id,
+            ProjectInvitation.status == _PENDING
         )
+        .values(status=_DECLINED)
+    )
+    if result.rowcount == 0:
+        raise await _diagnose_failed_transition(
+            db, invitation_id, current_user.id, "decline"
+        )
+    await db.commit()
+
+    return {"message": "Invitation declined successfully"}
@@ -1,13 +1,29 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+import asyncio
+import base64
+import binascii
+import logging
+import orjson
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from typing import List, Optional, Tuple
 from uuid import UUID
-from pydantic import BaseModel
-from sqlalchemy import select
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import and_, func, select
 
-from app.db.session import SessionDep
+from app.core.cache import cache_delete, cache_get_json, cache_set_json
+from app.db.session import AsyncSessionLocal, SessionDep
 from app.dependencies.auth import CurrentActiveUser
+from app.dependencies.projects import (
+    AdminRoleDep,
+    OwnerOrAdminRoleDep,
+    ProjectServiceDep
+)
 from app.services.project_service import ProjectService
-from app.models.ticket import Ticket
+from app.models.invitation import ProjectInvitation
+from app.models.project import ProjectMember, ProjectRole
+from app.models.ticket import Status, Ticket
+from app.models.user import User
+from app.utils.router_helpers import ErrorHandler
 from app.schemas.project import (
     ProjectCreate, 
     ProjectUpdate, 
@@ -18,17 +34,116 @@ from app.schemas.project import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class MemberRoleUpdate(BaseModel):
     role: str
 
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
+# Compiled once at import for the list endpoints: one C-level pass over
+# the whole page instead of a model_validate call per row
+_project_list_adapter = TypeAdapter(List[ProjectResponse])
+_member_list_adapter = TypeAdapter(List[ProjectMemberResponse])
+_project_adapter = TypeAdapter(ProjectResponse)
+
+# Dashboard pages re-request these lists constantly while the data
+# changes rarely; a short TTL absorbs the repeats and membership
+# mutations invalidate eagerly
+_LIST_CACHE_TTL = 30
+
+# Allowed-role sets for the failure-path diagnostics, built once at
+# import: O(1) membership checks with no per-request construction
+_OWNER = frozenset({"owner"})
+_ADMIN = frozenset({"admin"})
+
+
+def _serialize_list(adapter: TypeAdapter, items) -> Response:
+    """Serialize a page of rows straight to JSON bytes.
+
+    Returning a prebuilt Response skips response_model re-validation and
+    the jsonable_encoder walk; routes keep response_model declared for
+    OpenAPI only. Same idiom as the comments router.
+    """
+    validated = adapter.validate_python(items, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(validated),
+        media_type="application/json"
+    )
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    """Decode an opaque keyset cursor: base64("isoformat|uuid")"""
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts, _, row_id = raw.partition("|")
+        return datetime.fromisoformat(ts), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _encode_cursor(ts: datetime, row_id: UUID) -> str:
+    return base64.urlsafe_b64encode(
+        f"{ts.isoformat()}|{row_id}".encode()
+    ).decode()
+
+
+def _page_response(
+    adapter: TypeAdapter, rows, limit: int, cursor_key
+) -> Response:
+    """Build a {data, next_cursor, has_more} page from limit+1 rows.
+
+    The extra row only signals that another page exists; it is not
+    returned. next_cursor points at the last row actually served.
+    """
+    has_more = len(rows) > limit
+    page = rows[:limit]
+    next_cursor = (
+        _encode_cursor(*cursor_key(page[-1])) if has_more else None
+    )
+    validated = adapter.validate_python(page, from_attributes=True)
+    body = (
+        b'{"data":' + adapter.dump_json(validated)
+        + b',"next_cursor":' + orjson.dumps(next_cursor)
+        + b',"has_more":' + (b"true" if has_more else b"false") + b"}"
+    )
+    return Response(content=body, media_type="application/json")
+
+
+async def _require_role_on_failure(
+    service: ProjectService,
+    project_id: UUID,
+    user_id: UUID,
+    allowed: frozenset,
+    detail: str
+) -> None:
+    """Disambiguate a guarded mutation that matched no row.
+
+    The mutating statements carry the authorization predicate in their
+    WHERE clause, so this SELECT only runs on the failure path: raise
+    403 when the actor lacks the role, otherwise fall through so the
+    caller can raise its not-found error.
+    """
+    # get_member_role normalizes to the plain value string
+    role = await service.get_member_role(project_id, user_id)
+    if role not in allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=detail
+        )
+
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser  # Anyone can create projects
 ):
     """
@@ -40,11 +155,11 @@ async def create_project(
     - **is_private**: Whether project is private (default: true)
     """
     try:
-        service = ProjectService(db)
         project = await service.create_project(
             data=project_data.model_dump(),
             created_by=current_user.id
         )
+        await cache_delete(f"projects:{current_user.id}")
         return ProjectResponse.model_validate(project)
     except ValueError as e:
         raise HTTPException(
@@ -53,30 +168,52 @@ async def create_project(
         )
 
 
-@router.get("", response_model=List[ProjectResponse])
+@router.get("")
 async def list_projects(
-    db: SessionDep,
-    current_user: CurrentActiveUser
+    service: ProjectServiceDep,
+    current_user: CurrentActiveUser,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100)
 ):
     """
-    List all projects where user is a member.
+    List projects where user is a member, newest first.
+
+    Keyset paginated: pass the returned next_cursor to fetch the next
+    page. Only the cursor-less first page at the default limit is
+    cached — that is the page dashboards hammer, and it keeps the
+    mutation-side invalidation to one key per user.
     """
-    service = ProjectService(db)
-    projects = await service.get_user_projects(current_user.id)
-    
-    return [ProjectResponse.model_validate(p) for p in projects]
+    cacheable = cursor is None and limit == 50
+    cache_key = f"projects:{current_user.id}"
+    if cacheable:
+        cached = await cache_get_json(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    projects = await service.get_user_projects(
+        current_user.id, cursor=_decode_cursor(cursor), limit=limit + 1
+    )
+
+    response = _page_response(
+        _project_list_adapter, projects, limit,
+        lambda p: (p.created_at, p.id)
+    )
+    if cacheable:
+        await cache_set_json(
+            cache_key, response.body.decode(), ttl=_LIST_CACHE_TTL
+        )
+    return response
 
 
 @router.get("/{project_id}/me/role")
 async def get_current_user_role(
     project_id: UUID,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
     """
     Get the current user's role in a project.
     """
-    service = ProjectService(db)
     try:
         role = await service.get_member_role(project_id, current_user.id)
         return {"role": role}
@@ -90,89 +227,88 @@ async def get_current_user_role(
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
-    """Get project details by ID"""
-    service = ProjectService(db)
-    project = await service.get_project(project_id)
-    
+    """Get project details by ID.
+
+    The membership check rides the same SELECT as the project fetch,
+    so authorization costs no extra round-trip.
+    """
+    project, role = await service.get_project_with_role(
+        project_id, current_user.id
+    )
+
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
-    
-    # Check if user is a member
-    is_member = await service.is_member(project_id, current_user.id)
-    if not is_member:
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
-    
-    return ProjectResponse.model_validate(project)
+
+    # Prebuilt Response: one validate + Rust-level dump_json instead of
+    # model_validate followed by response_model re-validation;
+    # response_model stays declared for OpenAPI only
+    validated = _project_adapter.validate_python(project, from_attributes=True)
+    return Response(
+        content=_project_adapter.dump_json(validated),
+        media_type="application/json"
+    )
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
     """
     Update project details (Project owner only).
     """
-    service = ProjectService(db)
-    
-    # Check if user is project owner
-    member_role = await service.get_member_role(project_id, current_user.id)
-    role_value = member_role.value if hasattr(member_role, 'value') else member_role
-    if member_role is None or role_value != "owner":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only project owners can update projects"
+
+    # Ownership is enforced inside the UPDATE's WHERE clause; only the
+    # failure path spends a second query on diagnosis
+    update_data = project_data.model_dump(exclude_unset=True)
+    project = await service.update_project_if(project_id, current_user.id, update_data)
+    if project is None:
+        await _require_role_on_failure(
+            service, project_id, current_user.id, _OWNER,
+            "Only project owners can update projects"
         )
-    
-    try:
-        # Only update non-None fields
-        update_data = project_data.model_dump(exclude_unset=True)
-        project = await service.update_project(project_id, update_data)
-        return ProjectResponse.model_validate(project)
-    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
         )
+    return ProjectResponse.model_validate(project)
 
 
 @router.delete("/{project_id}")
 async def delete_project(
     project_id: UUID,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
     """Permanently delete a project and all related data (Admin only)"""
-    service = ProjectService(db)
-    
-    # Check if user is project admin
-    member_role = await service.get_member_role(project_id, current_user.id)
-    role_value = member_role.value if hasattr(member_role, 'value') else member_role
-    if member_role is None or role_value != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only project admins can delete projects"
+
+    # Admin check is enforced inside the UPDATE's WHERE clause
+    archived = await service.archive_project_if(
+        project_id, current_user.id, roles=(ProjectRole.ADMIN,)
+    )
+    if not archived:
+        await _require_role_on_failure(
+            service, project_id, current_user.id, _ADMIN,
+            "Only project admins can delete projects"
         )
-    
-    try:
-        await service.delete_project(project_id)
-        return {"message": "Project deleted successfully", "project_id": str(project_id)}
-    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
+            detail="Project not found"
         )
+    return {"message": "Project deleted successfully", "project_id": str(project_id)}
 
 
 # Project Members Management
@@ -180,23 +316,14 @@ async def delete_project(
 async def add_project_member(
     project_id: UUID,
     member_data: ProjectMemberAdd,
-    db: SessionDep,
-    current_user: CurrentActiveUser
+    service: ProjectServiceDep,
+    current_user: CurrentActiveUser,
+    _actor_role: OwnerOrAdminRoleDep
 ):
     """
-    Add a member to the project (Project owner/admin only).
+    Add a member to the project (Project owner/admin only,
+    enforced by dependency).
     """
-    service = ProjectService(db)
-    
-    # Check if user is project owner or admin
-    member_role = await service.get_member_role(project_id, current_user.id)
-    role_value = member_role.value if hasattr(member_role, 'value') else member_role
-    if member_role is None or role_value not in ["owner", "admin"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only project owners/admins can add members"
-        )
-    
     try:
         member = await service.add_member(
             project_id=project_id,
@@ -204,6 +331,9 @@ async def add_project_member(
             role=member_data.role,
             added_by=current_user.id
         )
+        await cache_delete(
+            f"members:{project_id}", f"projects:{member_data.user_id}"
+        )
         return ProjectMemberResponse.model_validate(member)
     except ValueError as e:
         raise HTTPException(
@@ -212,55 +342,76 @@ async def add_project_member(
         )
 
 
-@router.get("/{project_id}/members", response_model=List[ProjectMemberResponse])
+@router.get("/{project_id}/members")
 async def list_project_members(
     project_id: UUID,
-    db: SessionDep,
-    current_user: CurrentActiveUser
+    service: ProjectServiceDep,
+    current_user: CurrentActiveUser,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100)
 ):
-    """List all members of a project"""
-    service = ProjectService(db)
-    
-    # Check if user is a member
-    is_member = await service.is_member(project_id, current_user.id)
-    if not is_member:
+    """List members of a project, newest first (members only).
+
+    Keyset paginated like the project listing. The caller's own row is
+    no longer guaranteed to be on the page, so authorization goes
+    through the role cache tiers (usually a dict hit, no DB).
+    """
+    if await service.get_member_role(project_id, current_user.id) is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
-    
-    members = await service.get_project_members(project_id)
-    return [ProjectMemberResponse.model_validate(m) for m in members]
+
+    # The member page is identical for every viewer, so the first page
+    # at the default limit is cached per project
+    cacheable = cursor is None and limit == 50
+    cache_key = f"members:{project_id}"
+    if cacheable:
+        cached = await cache_get_json(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    members = await service.get_project_members(
+        project_id, cursor=_decode_cursor(cursor), limit=limit + 1
+    )
+
+    response = _page_response(
+        _member_list_adapter, members, limit,
+        lambda m: (m.joined_at, m.id)
+    )
+    if cacheable:
+        await cache_set_json(
+            cache_key, response.body.decode(), ttl=_LIST_CACHE_TTL
+        )
+    return response
 
 
 @router.get("/{project_id}/members/{user_id}", response_model=ProjectMemberResponse)
 async def get_project_member(
     project_id: UUID,
     user_id: UUID,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
-    """Get a specific member of a project"""
-    service = ProjectService(db)
-    
-    # Check if user is a member
-    is_member = await service.is_member(project_id, current_user.id)
-    if not is_member:
+    """Get a specific member of a project (members only)"""
+
+    # One SELECT covers both the caller's membership check and the
+    # target row, instead of loading the whole member list
+    member, caller_role = await service.get_member_with_caller_role(
+        project_id, user_id, current_user.id
+    )
+
+    if caller_role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
-    
-    # Get the member
-    members = await service.get_project_members(project_id)
-    member = next((m for m in members if m.user_id == user_id), None)
-    
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found in this project"
         )
-    
+
     return ProjectMemberResponse.model_validate(member)
 
 
@@ -269,35 +420,28 @@ async def update_member_role(
     project_id: UUID,
     user_id: UUID,
     role_data: ProjectMemberUpdate,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
     """
     Update a member's role in the project (Project owner only).
     """
-    service = ProjectService(db)
-    
-    # Check if user is project owner
-    member_role = await service.get_member_role(project_id, current_user.id)
-    role_value = member_role.value if hasattr(member_role, 'value') else member_role
-    if member_role is None or role_value != "owner":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only project owners can update member roles"
-        )
-    
-    try:
-        member = await service.update_member_role(
-            project_id=project_id,
-            user_id=user_id,
-            role=role_data.role
+
+    # Ownership is enforced inside the UPDATE's WHERE clause
+    member = await service.update_member_role_if(
+        project_id, user_id, role_data.role, current_user.id
+    )
+    if member is None:
+        await _require_role_on_failure(
+            service, project_id, current_user.id, _OWNER,
+            "Only project owners can update member roles"
         )
-        return ProjectMemberResponse.model_validate(member)
-    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            detail="Member not found in project"
         )
+    await cache_delete(f"members:{project_id}")
+    return ProjectMemberResponse.model_validate(member)
 
 
 
@@ -307,168 +451,155 @@ async def update_project_member_role(
     project_id: UUID,
     member_id: str,
     update_data: MemberRoleUpdate,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
     """
     Update a member's role in the project (Project owner only).
     Accepts member_id as UUID or username.
     """
-    from sqlalchemy import select
-    from app.models.user import User
-    from sqlalchemy.exc import SQLAlchemyError
-    
-    service = ProjectService(db)
-    
-    # Check if user is project owner
-    member_role = await service.get_member_role(project_id, current_user.id)
-    role_value = member_role.value if hasattr(member_role, 'value') else member_role
-    if member_role is None or role_value != "owner":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only project owners can change member roles"
+    # A username resolves inside the UPDATE via an IN-subquery, so the
+    # lookup and the mutation share one round-trip; ownership is
+    # enforced inside the WHERE clause either way
+    member = await service.update_member_role_by_identifier(
+        project_id, member_id, update_data.role, current_user.id
+    )
+    if member is None:
+        await _require_role_on_failure(
+            service, project_id, current_user.id, _OWNER,
+            "Only project owners can change member roles"
         )
-    
-    # Try to parse as UUID, otherwise treat as username
-    user_id = None
-    try:
-        user_id = UUID(member_id)
-    except ValueError:
-        # It's likely a username, look it up
-        try:
-            result = await db.execute(
-                select(User).where(User.username == member_id)
-            )
-            user = result.scalar_one_or_none()
-            if user:
-                user_id = user.id
-        except SQLAlchemyError:
-            pass
-    
-    if not user_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid member_id or username"
-        )
-    
-    try:
-        await service.update_member_role(project_id, user_id, update_data.role)
-        return {"message": "Member role updated successfully", "role": update_data.role}
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            detail="Member not found in project"
         )
+    await cache_delete(f"members:{project_id}")
+    return {"message": "Member role updated successfully", "role": update_data.role}
 
 
 @router.delete("/{project_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_project_member(
     project_id: UUID,
     user_id: UUID,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
     """
     Remove a member from the project (Project owner only).
     """
-    service = ProjectService(db)
-    
-    # Check if user is project owner
-    member_role = await service.get_member_role(project_id, current_user.id)
-    role_value = member_role.value if hasattr(member_role, 'value') else member_role
-    if member_role is None or role_value != "owner":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only project owners can remove members"
+
+    # Ownership (and the never-remove-the-owner rule) is enforced inside
+    # the DELETE's WHERE clause
+    removed = await service.remove_member_if(project_id, user_id, current_user.id)
+    if not removed:
+        await _require_role_on_failure(
+            service, project_id, current_user.id, _OWNER,
+            "Only project owners can remove members"
         )
-    
-    try:
-        await service.remove_member(project_id, user_id)
-    except ValueError as e:
+        target_role = await service.get_member_role(project_id, user_id)
+        if target_role is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot remove project owner"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            detail="Member not found in project"
         )
+    await cache_delete(f"members:{project_id}", f"projects:{user_id}")
 
 
 @router.get("/{project_id}/stats")
 async def get_project_stats(
     project_id: UUID,
-    db: SessionDep,
+    service: ProjectServiceDep,
     current_user: CurrentActiveUser
 ):
     """
-    Get statistics for a project (ticket counts, members, etc.)
+    Get statistics for a project (ticket counts, members, etc.; members only)
     """
-    service = ProjectService(db)
-    
-    # Check if user is a member
-    is_member = await service.is_member(project_id, current_user.id)
-    if not is_member:
+    # Project fetch and membership check share one SELECT
+    project, role = await service.get_project_with_role(
+        project_id, current_user.id
+    )
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
-    
-    try:
-        # Get project details
-        project = await service.get_project(project_id)
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Project not found"
+
+    # Aggregate in the database: a handful of count rows cross the wire
+    # instead of every ticket ORM object, and the counting loops move
+    # off the event loop into Postgres. The three aggregations are
+    # independent, so each runs on its own pooled connection and they
+    # overlap — the endpoint waits for the slowest one, not the sum.
+    # (A single AsyncSession cannot execute concurrently.)
+    # due_date is a timestamptz, so the comparison operand must be aware
+    now = datetime.now(timezone.utc)
+
+    async def run(stmt):
+        async with AsyncSessionLocal() as session:
+            return await session.execute(stmt)
+
+    status_result, priority_result, scalars_result = await asyncio.gather(
+        run(
+            select(Ticket.status, func.count())
+            .where(Ticket.project_id == project_id)
+            .group_by(Ticket.status)
+        ),
+        run(
+            select(Ticket.priority, func.count())
+            .where(Ticket.project_id == project_id)
+            .group_by(Ticket.priority)
+        ),
+        # Overdue tickets and member count fit in one two-column SELECT
+        # of scalar subqueries
+        run(
+            select(
+                select(func.count())
+                .select_from(Ticket)
+                .where(
+                    Ticket.project_id == project_id,
+                    Ticket.due_date < now,
+                    Ticket.status != Status.DONE
+                )
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ProjectMember)
+                .where(ProjectMember.project_id == project_id)
+                .scalar_subquery()
             )
-        
-        # Get all tickets for this project
-        tickets_query = select(Ticket).where(Ticket.project_id == project_id)
-        result = await db.execute(tickets_query)
-        tickets = result.scalars().all()
-        
-        # Get member count
-        members = await service.get_project_members(project_id)
-        member_count = len(members) if members else 0
-        
-        # Calculate stats
-        total_tickets = len(tickets)
-        
-        # Count by status
-        tickets_by_status = {}
-        for ticket in tickets:
-            status_str = str(ticket.status)
-            tickets_by_status[status_str] = tickets_by_status.get(status_str, 0) + 1
-        
-        # Count by priority
-        tickets_by_priority = {}
-        for ticket in tickets:
-            priority_str = str(ticket.priority)
-            tickets_by_priority[priority_str] = tickets_by_priority.get(priority_str, 0) + 1
-        
-        # Count overdue tickets (tickets with status not "done" and past due date)
-        overdue_count = 0
-        from datetime import datetime
-        now = datetime.utcnow()
-        for ticket in tickets:
-            if ticket.due_date and ticket.due_date < now and str(ticket.status) != "done":
-                overdue_count += 1
-        
-        # Calculate completion rate
-        completed = tickets_by_status.get("done", 0)
-        completion_rate = int((completed / total_tickets * 100) if total_tickets > 0 else 0)
-        
-        # Return stats
-        return {
-            "total_tickets": total_tickets,
-            "tickets_by_status": tickets_by_status,
-            "tickets_by_priority": tickets_by_priority,
-            "overdue_tickets": overdue_count,
-            "team_members": member_count,
-            "completion_rate": completion_rate
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
         )
+    )
+
+    tickets_by_status = {
+        (s.value if hasattr(s, 'value') else str(s)): count
+        for s, count in status_result.all()
+    }
+    tickets_by_priority = {
+        (p.value if hasattr(p, 'value') else str(p)): count
+        for p, count in priority_result.all()
+    }
+    overdue_count, member_count = scalars_result.one()
+
+    total_tickets = sum(tickets_by_status.values())
+    completed = tickets_by_status.get("done", 0)
+    completion_rate = int((completed / total_tickets * 100) if total_tickets > 0 else 0)
+
+    # Return stats
+    return {
+        "total_tickets": total_tickets,
+        "tickets_by_status": tickets_by_status,
+        "tickets_by_priority": tickets_by_priority,
+        "overdue_tickets": overdue_count,
+        "team_members": member_count,
+        "completion_rate": completion_rate
+    }
 
 
 # ========== SEND PROJECT INVITATION ==========
@@ -482,61 +613,58 @@ async def send_project_invitation(
     project_id: UUID,
     invitation_data: InvitationRequest,
     db: SessionDep,
-    current_user: CurrentActiveUser
+    service: ProjectServiceDep,
+    current_user: CurrentActiveUser,
+    _actor_role: AdminRoleDep
 ):
-    """Send an invitation to a user to join the project"""
-    from app.models.invitation import ProjectInvitation
-    from app.models.user import User
-    from app.models.project import Project
-    from app.utils.router_helpers import ErrorHandler
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
-    try:
-        # Verify project exists
-        project = await db.get(Project, project_id)
-        if not project:
-            raise ErrorHandler.handle_not_found("Project", project_id)
-        
-        # Check if user is admin of the project
-        service = ProjectService(db)
-        user_role = await service.get_member_role(project_id, current_user.id)
-        role_value = user_role.value if hasattr(user_role, 'value') else user_role
-        if user_role is None or role_value != "admin":
-            raise ErrorHandler.handle_permission_denied("Only admins can invite members")
-        
-        # Verify user exists
-        invite_user = await db.get(User, invitation_data.user_id)
-        if not invite_user:
-            raise ErrorHandler.handle_not_found("User", invitation_data.user_id)
-        
-        # Check if user is already a member
-        is_member = await service.is_member(project_id, invitation_data.user_id)
-        if is_member:
-            raise ErrorHandler.handle_conflict("User is already a member of this project")
-        
-        # Create invitation
-        invitation = ProjectInvitation(
-            project_id=project_id,
-            user_id=invitation_data.user_id,
-            role=invitation_data.role,
-            invited_by=current_user.id
+    """Send an invitation to a user to join the project (admins only,
+    enforced by dependency).
+
+    Database errors propagate to the app-level SQLAlchemyError handler;
+    the old blanket except converted every HTTPException raised below
+    into a 500.
+    """
+    # The admin dependency already proves the project exists (a role
+    # can only exist for a real project), so no separate existence
+    # check. The two remaining facts — the invitee exists, the invitee
+    # isn't already a member — come back in one SELECT with their
+    # membership row LEFT JOINed onto the user lookup.
+    row = (await db.execute(
+        select(User.id, ProjectMember.id)
+        .outerjoin(
+            ProjectMember,
+            and_(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id == User.id
+            )
         )
-        db.add(invitation)
-        await db.flush()
-        
-        logger.info(f"Invitation created: {invitation.id} for user {invitation_data.user_id} to project {project_id}")
-        
-        return {
-            "id": str(invitation.id),
-            "project_id": str(invitation.project_id),
-            "user_id": str(invitation.user_id),
-            "role": invitation.role,
-            "status": invitation.status,
-            "created_at": invitation.created_at.isoformat(),
-            "expires_at": invitation.expires_at.isoformat(),
-        }
-    except Exception as e:
-        logger.error(f"Failed to send invitation: {str(e)}", exc_info=True)
-        raise ErrorHandler.handle_internal_error("Failed to create invitation")
+        .where(User.id == invitation_data.user_id)
+    )).first()
+    if row is None:
+        raise ErrorHandler.handle_not_found("User", invitation_data.user_id)
+    if row[1] is not None:
+        raise ErrorHandler.handle_conflict("User is already a member of this project")
+
+    # Create invitation
+    invitation = ProjectInvitation(
+        project_id=project_id,
+        user_id=invitation_data.user_id,
+        role=invitation_data.role,
+        invited_by=current_user.id
+    )
+    db.add(invitation)
+    await db.flush()
+
+    logger.info(f"Invitation created: {invitation.id} for user {invitation_data.user_id} to project {project_id}")
+
+    # orjson serializes UUIDs and datetimes natively; no manual
+    # str()/isoformat() conversion needed
+    return {
+        "id": invitation.id,
+        "project_id": invitation.project_id,
+        "user_id": invitation.user_id,
+        "role": invitation.role,
+        "status": invitation.status,
+        "created_at": invitation.created_at,
+        "expires_at": invitation.expires_at,
+    }
@@ -12,13 +12,14 @@ from app.models.ticket import IssueType, Priority
 from app.models.user import User
 from app.dependencies.auth import CurrentActiveUser
 from app.dependencies.tickets import TicketServiceDep
+from app.dependencies.projects import ProjectServiceDep
 from app.db.session import SessionDep
-from app.services.project_service import ProjectService
 from app.utils.router_helpers import PermissionChecker, ResponseBuilder
 from app.schemas.user import UserResponse
 from pydantic import BaseModel
 from urllib.parse import unquote
 import logging
+import operator
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,95 @@ async def get_permission_checker(db: SessionDep) -> PermissionChecker:
     return PermissionChecker(db)
 
 
+# ============= RESPONSE HELPERS =============
+def _user_response(user: User) -> UserResponse:
+    """Build a UserResponse from an ORM row, skipping validation.
+
+    The values come straight from SQLAlchemy with correctly typed
+    columns, so model_construct safely bypasses Pydantic's per-field
+    validators on the hot list/search paths. Client input (create and
+    update payloads) still goes through full validation.
+    """
+    return UserResponse.model_construct(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        full_name=user.full_name,
+        avatar_url=user.avatar_url,
+        role=user.role,
+        timezone=user.timezone,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        last_login=user.last_login,
+    )
+
+
+# Scalar Ticket columns copied verbatim into TicketWithDetails; the
+# attrgetter walks the descriptors in one C-level call per row instead
+# of sixteen separate getattr lookups
+_TICKET_FIELD_NAMES = (
+    'id', 'key', 'project_id', 'status', 'resolution', 'assignee_id',
+    'reporter_id', 'order_index', 'created_at', 'updated_at',
+    'resolved_at', 'type', 'title', 'description', 'due_date', 'priority',
+)
+_TICKET_ATTRS = operator.attrgetter(*_TICKET_FIELD_NAMES)
+
+
+def _ticket_with_details(t, reporter=None, assignee=None) -> TicketWithDetails:
+    """Build a TicketWithDetails from a trusted ORM row.
+
+    Same reasoning as _user_response: the data is already typed by the
+    database driver, so model_construct avoids re-validating every
+    field once per row. Reporter/assignee default to the row's
+    eager-loaded (selectinload) relationships; mutation paths that got
+    the row from RETURNING pass the users explicitly instead.
+    """
+    reporter = reporter if reporter is not None else t.reporter
+    assignee = assignee if assignee is not None else t.assignee
+    fields = dict(zip(_TICKET_FIELD_NAMES, _TICKET_ATTRS(t)))
+    fields['reporter'] = _user_response(reporter) if reporter else None
+    fields['assignee'] = _user_response(assignee) if assignee else None
+    fields['comments_count'] = 0
+    fields['attachments_count'] = 0
+    fields['labels'] = []
+    return TicketWithDetails.model_construct(**fields)
+
+
+async def _mutation_response(db, ticket) -> TicketWithDetails:
+    """Build the response for a guarded UPDATE ... RETURNING row.
+
+    RETURNING hands back the ticket without its noload relationships,
+    so one IN-query fetches the reporter (and assignee, when set).
+    """
+    user_ids = {ticket.reporter_id}
+    if ticket.assignee_id:
+        user_ids.add(ticket.assignee_id)
+    result = await db.execute(select(User).where(User.id.in_(user_ids)))
+    users_by_id = {u.id: u for u in result.scalars()}
+    return _ticket_with_details(
+        ticket,
+        reporter=users_by_id.get(ticket.reporter_id),
+        assignee=users_by_id.get(ticket.assignee_id) if ticket.assignee_id else None,
+    )
+
+
+async def _raise_for_failed_mutation(service, ticket_id: UUID) -> None:
+    """Turn a guarded-update miss into the right status code.
+
+    One diagnostic SELECT on the failure path only: a missing ticket
+    is 404, anything else is a permission problem.
+    """
+    if await service.get_ticket_by_id(ticket_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You don't have permission to perform this action"
+    )
+
+
 # ============= ENDPOINTS =============
 
 @router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -106,35 +196,22 @@ async def update_ticket(
     update_data: TicketUpdate,
     service: TicketServiceDep,
     db: SessionDep,
-    current_user: CurrentActiveUser,
-    permission_checker: PermissionChecker = Depends(get_permission_checker)
+    current_user: CurrentActiveUser
 ):
     """
     Update ticket details (title, description, priority, etc.).
     Available to: developers, reporters, assignees, and project admins.
     """
     try:
-        ticket = await service.get_ticket_by_id(ticket_id)
-        if not ticket:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Ticket not found"
-            )
-        
-        # Check permission
-        await permission_checker.check_ticket_edit_permission(
-            ticket,
-            current_user.id,
-            allow_reporter=True,
-            allow_assignee=True
-        )
-        
-        # Update via service
-        updated_ticket = await service.update_ticket(
+        # Permission check rides inside the guarded UPDATE's WHERE
+        updated_ticket = await service.update_ticket_if_permitted(
             ticket_id,
+            current_user.id,
             update_data.model_dump(exclude_unset=True)
         )
-        return TicketWithDetails.model_validate(updated_ticket)
+        if updated_ticket is None:
+            await _raise_for_failed_mutation(service, ticket_id)
+        return await _mutation_response(db, updated_ticket)
         
     except HTTPException:
         raise
@@ -152,36 +229,23 @@ async def change_ticket_status(
     status_data: ChangeStatusRequest,
     service: TicketServiceDep,
     db: SessionDep,
-    current_user: CurrentActiveUser,
-    permission_checker: PermissionChecker = Depends(get_permission_checker)
+    current_user: CurrentActiveUser
 ):
     """
     Change ticket status (todo → in_progress → done, etc.).
     Available to: developers, assignees, reporters, and project admins.
     """
     try:
-        ticket = await service.get_ticket_by_id(ticket_id)
-        if not ticket:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Ticket not found"
-            )
-        
-        # Check permission
-        await permission_checker.check_ticket_edit_permission(
-            ticket,
-            current_user.id,
-            allow_reporter=True,
-            allow_assignee=True
-        )
-        
-        # Update status via service
-        updated_ticket = await service.update_ticket_status(
+        # Permission check rides inside the guarded UPDATE's WHERE
+        updated_ticket = await service.update_ticket_status_if_permitted(
             ticket_id,
+            current_user.id,
             status_data.status,
             status_data.resolution
         )
-        return TicketWithDetails.model_validate(updated_ticket)
+        if updated_ticket is None:
+            await _raise_for_failed_mutation(service, ticket_id)
+        return await _mutation_response(db, updated_ticket)
         
     except HTTPException:
         raise
@@ -207,31 +271,30 @@ async def assign_ticket(
     Assignee must be a member of the project.
     """
     try:
-        ticket = await service.get_ticket_by_id(ticket_id)
-        if not ticket:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Ticket not found"
+        # Resolve the assignee, then let one guarded UPDATE assert both
+        # memberships (actor and assignee) alongside the assignment
+        assignee = await permission_checker.get_user_by_username(
+            assign_data.assignee_username
+        )
+        updated_ticket = await service.assign_ticket_if_permitted(
+            ticket_id, current_user.id, assignee.id
+        )
+        if updated_ticket is None:
+            # Failure path only: one SELECT decides 404 vs 403 vs 400
+            ticket = await service.get_ticket_by_id(ticket_id)
+            if not ticket:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Ticket not found"
+                )
+            await permission_checker.check_project_access(
+                ticket.project_id, current_user.id
             )
-        
-        # Check current user has access to project
-        await permission_checker.check_project_access(ticket.project_id, current_user.id)
-        
-        # Get assignee user
-        assignee = await permission_checker.get_user_by_username(assign_data.assignee_username)
-        
-        # Verify assignee is in the project
-        project_service = ProjectService(db)
-        is_assignee_member = await project_service.is_member(ticket.project_id, assignee.id)
-        if not is_assignee_member:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"User '{assign_data.assignee_username}' is not a member of this project"
             )
-        
-        # Assign ticket
-        updated_ticket = await service.assign_ticket(ticket_id, assignee.id)
-        return TicketWithDetails.model_validate(updated_ticket)
+        return await _mutation_response(db, updated_ticket)
         
     except HTTPException:
         raise
@@ -247,6 +310,7 @@ async def assign_ticket(
 async def get_project_members(
     project_id: UUID,
     db: SessionDep,
+    project_service: ProjectServiceDep,
     current_user: CurrentActiveUser,
     permission_checker: PermissionChecker = Depends(get_permission_checker)
 ):
@@ -257,24 +321,28 @@ async def get_project_members(
     try:
         # Check access
         await permission_checker.check_project_access(project_id, current_user.id)
-        
+
         # Get members
-        project_service = ProjectService(db)
         project_members = await project_service.get_project_members(project_id)
-        
-        # Build response
-        result_members = []
-        for pm in project_members:
-            user = await db.get(User, pm.user_id)
-            if user:
-                result_members.append(ProjectMemberResponse(
-                    id=user.id,
-                    username=user.username,
-                    email=user.email,
-                    full_name=user.full_name or ""
-                ))
-        
-        return result_members
+
+        # One IN-query for all member users instead of a db.get per row
+        member_ids = [pm.user_id for pm in project_members]
+        users = []
+        if member_ids:
+            users_result = await db.execute(
+                select(User).where(User.id.in_(member_ids))
+            )
+            users = users_result.scalars().all()
+
+        return [
+            ProjectMemberResponse(
+                id=user.id,
+                username=user.username,
+                email=user.email,
+                full_name=user.full_name or ""
+            )
+            for user in users
+        ]
         
     except HTTPException:
         raise
@@ -289,7 +357,6 @@ async def get_project_members(
 @router.get("/{project_name}/search", response_model=SearchResponse)
 async def search_tickets(
     project_name: str,
-    db: SessionDep,
     service: TicketServiceDep,
     current_user: CurrentActiveUser,
     permission_checker: PermissionChecker = Depends(get_permission_checker),
@@ -334,46 +401,11 @@ async def search_tickets(
             sort_order=sort_order
         )
         
-        # Build detailed responses
-        ticket_responses = []
-        for t in tickets:
-            reporter_result = await db.execute(
-                select(User).where(User.id == t.reporter_id)
-            )
-            reporter = reporter_result.scalar_one_or_none()
-            
-            assignee = None
-            if t.assignee_id:
-                assignee_result = await db.execute(
-                    select(User).where(User.id == t.assignee_id)
-                )
-                assignee = assignee_result.scalar_one_or_none()
-            
-            ticket_data = {
-                'id': t.id,
-                'key': t.key,
-                'project_id': t.project_id,
-                'status': t.status,
-                'resolution': t.resolution,
-                'assignee_id': t.assignee_id,
-                'reporter_id': t.reporter_id,
-                'order_index': t.order_index,
-                'created_at': t.created_at,
-                'updated_at': t.updated_at,
-                'resolved_at': t.resolved_at,
-                'type': t.type,
-                'title': t.title,
-                'description': t.description,
-                'due_date': t.due_date,
-                'priority': t.priority,
-                'reporter': UserResponse.model_validate(reporter) if reporter else None,
-                'assignee': UserResponse.model_validate(assignee) if assignee else None,
-                'comments_count': 0,
-                'attachments_count': 0,
-                'labels': []
-            }
-            ticket_responses.append(TicketWithDetails(**ticket_data))
-        
+        # Reporters/assignees arrive eager-loaded (selectinload) with
+        # the service query; build responses from trusted rows without
+        # re-validation
+        ticket_responses = [_ticket_with_details(t) for t in tickets]
+
         return SearchResponse(
             total=total_count,
             count=len(tickets),
@@ -396,7 +428,6 @@ async def search_tickets(
 async def list_tickets(
     project_name: str,
     service: TicketServiceDep,
-    db: SessionDep,
     current_user: CurrentActiveUser,
     permission_checker: PermissionChecker = Depends(get_permission_checker)
 ):
@@ -413,9 +444,10 @@ async def list_tickets(
         # Check access
         await permission_checker.check_project_access(project.id, current_user.id)
         
-        # Get tickets
+        # Reporters/assignees arrive eager-loaded (selectinload) with
+        # the service query
         tickets = await service.get_tickets(project_id=project.id)
-        return [TicketWithDetails.model_validate(t) for t in tickets]
+        return [_ticket_with_details(t) for t in tickets]
         
     except HTTPException:
         raise
@@ -0,0 +1,87 @@
+"""
+Redis cache helpers for hot read paths.
+
+The cache is best-effort: when redis_url is not configured or Redis is
+unreachable, every helper degrades to a no-op so request handling never
+depends on the cache being up. Eviction is left to the Redis server;
+configure `maxmemory-policy allkeys-lfu` so frequently read keys
+(attachment metadata, user lookups) survive memory pressure.
+"""
+import json
+import logging
+from typing import Any, Optional
+
+from redis import asyncio as aioredis
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Get the shared Redis client, or None when caching is disabled"""
+    global _redis
+    if not settings.redis_url:
+        return None
+    if _redis is None:
+        _redis = aioredis.from_url(
+            settings.redis_url,
+            encoding="utf-8",
+            decode_responses=True
+        )
+    return _redis
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """Get a JSON value from the cache, None on miss or Redis failure"""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        value = await redis.get(key)
+        return json.loads(value) if value is not None else None
+    except Exception as e:
+        logger.warning(f"Cache read failed for '{key}': {str(e)}")
+        return None
+
+
+async def cache_set_json(key: str, value: Any, ttl: Optional[int] = None) -> None:
+    """Store a JSON-serializable value in the cache with a TTL"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(key, json.dumps(value), ex=ttl or settings.cache_ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Cache write failed for '{key}': {str(e)}")
+
+
+async def cache_delete(*keys: str) -> None:
+    """Invalidate cache entries"""
+    redis = get_redis()
+    if redis is None or not keys:
+        return
+    try:
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {keys}: {str(e)}")
+
+
+async def publish_event(stream: str, fields: dict) -> None:
+    """Append an event to a Redis stream for out-of-process consumers.
+
+    Side effects (welcome emails, audit rows) belong in a separate worker
+    reading the stream, not in the web process after the response. XADD is
+    O(1) and in-memory, so publishing costs microseconds on the hot path.
+    Best-effort like the cache: a dropped event never fails the request.
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.xadd(stream, fields, maxlen=100_000, approximate=True)
+    except Exception as e:
+        logger.warning(f"Event publish failed for stream '{stream}': {str(e)}")
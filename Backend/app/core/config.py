@@ -40,6 +40,21 @@ class Settings(BaseSettings):
     
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:8000"]
+
+    # Attachment downloads: when enabled, delegate file serving to the
+    # reverse proxy via X-Accel-Redirect (nginx internal location)
+    accel_redirect_enabled: bool = False
+    accel_redirect_prefix: str = "/protected/attachments"
+
+    # Redis cache (disabled when redis_url is empty)
+    redis_url: str = ""
+    cache_ttl_seconds: int = 60
+
+    # Database pool; size for expected concurrency so requests queue in
+    # the pool instead of failing with QueuePool limit errors
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_timeout: int = 30
     
     class Config:
         env_file = str(ENV_FILE)
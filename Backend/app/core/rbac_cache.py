@@ -0,0 +1,91 @@
+"""
+L2 Redis tier for project role lookups, with pub/sub invalidation.
+
+The in-process TTL cache in project_service is incoherent across uvicorn
+workers: a role change applied on one worker leaves stale entries on its
+peers for up to a TTL. This module adds a shared Redis tier behind it and
+a broadcast channel so a mutation on any worker evicts every process's
+local entry. Best-effort like app.core.cache: when Redis is unavailable
+lookups fall through to the database and invalidation stays local.
+"""
+import asyncio
+import logging
+from typing import Callable, Optional
+from uuid import UUID
+
+from app.core.cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+_ROLE_TTL = 600
+_CHANNEL = "rbac:invalidate"
+
+
+def _key(project_id: UUID, user_id: UUID) -> str:
+    return f"rbac:{project_id}:{user_id}"
+
+
+async def get_role(project_id: UUID, user_id: UUID) -> Optional[str]:
+    """Get a cached role value, None on miss or Redis failure"""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        return await redis.get(_key(project_id, user_id))
+    except Exception as e:
+        logger.warning(f"RBAC cache read failed: {str(e)}")
+        return None
+
+
+async def set_role(project_id: UUID, user_id: UUID, role_value: str) -> None:
+    """Store a role value (the enum's .value string) with a TTL"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(_key(project_id, user_id), role_value, ex=_ROLE_TTL)
+    except Exception as e:
+        logger.warning(f"RBAC cache write failed: {str(e)}")
+
+
+async def invalidate(project_id: UUID, user_id: UUID) -> None:
+    """Drop the shared entry and tell every worker to drop its local one"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(_key(project_id, user_id))
+        await redis.publish(_CHANNEL, f"{project_id}:{user_id}")
+    except Exception as e:
+        logger.warning(f"RBAC cache invalidation failed: {str(e)}")
+
+
+async def listen_for_invalidations(
+    evict: Callable[[UUID, UUID], None]
+) -> None:
+    """Subscribe to the invalidation channel and evict local entries.
+
+    Runs as a background task for the life of the process (started from
+    the app lifespan). Each message carries "project_id:user_id"; the
+    evict callback drops that pair from the caller's in-process cache.
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(_CHANNEL)
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                pid, uid = message["data"].split(":", 1)
+                evict(UUID(pid), UUID(uid))
+            except (ValueError, KeyError):
+                logger.warning(
+                    f"Malformed RBAC invalidation message: {message!r}"
+                )
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"RBAC invalidation listener stopped: {str(e)}")
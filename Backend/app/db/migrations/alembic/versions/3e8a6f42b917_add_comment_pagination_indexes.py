@@ -0,0 +1,41 @@
+"""add_comment_pagination_indexes
+
+Revision ID: 3e8a6f42b917
+Revises: 7b2f91c0d5a8
+Create Date: 2026-08-29 14:37:11.204918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8a6f42b917'
+down_revision: Union[str, Sequence[str], None] = '7b2f91c0d5a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index serves the top-level comments page as an ordered
+    # index-range scan (no sort, no heap filter on parent_id)
+    op.create_index(
+        'comments_ticket_toplevel_idx',
+        'comments',
+        ['ticket_id', 'created_at'],
+        postgresql_where=sa.text('parent_id IS NULL')
+    )
+    # Replies pages: WHERE parent_id = :pid ORDER BY created_at
+    op.create_index(
+        'comments_parent_created_idx',
+        'comments',
+        ['parent_id', 'created_at']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('comments_parent_created_idx', table_name='comments')
+    op.drop_index('comments_ticket_toplevel_idx', table_name='comments')
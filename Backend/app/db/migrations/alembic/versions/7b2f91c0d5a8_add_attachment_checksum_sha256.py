@@ -0,0 +1,27 @@
+"""add_attachment_checksum_sha256
+
+Revision ID: 7b2f91c0d5a8
+Revises: 4d3434001fe3
+Create Date: 2026-08-29 10:12:03.421855
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2f91c0d5a8'
+down_revision: Union[str, Sequence[str], None] = '4d3434001fe3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('attachments', sa.Column('checksum_sha256', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('attachments', 'checksum_sha256')
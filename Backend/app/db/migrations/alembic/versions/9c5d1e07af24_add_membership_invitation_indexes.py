@@ -0,0 +1,37 @@
+"""add_membership_invitation_indexes
+
+Revision ID: 9c5d1e07af24
+Revises: 3e8a6f42b917
+Create Date: 2026-08-29 16:05:42.318274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9c5d1e07af24'
+down_revision: Union[str, Sequence[str], None] = '3e8a6f42b917'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Pending-invitations listing: WHERE user_id = :uid AND status = :st
+    op.create_index(
+        'ix_inv_user_status',
+        'project_invitations',
+        ['user_id', 'status']
+    )
+    # get_user_projects joins project_members on user_id alone;
+    # (project_id, user_id) lookups are already covered by the
+    # unique_project_user constraint's index
+    op.create_index('ix_pm_user', 'project_members', ['user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pm_user', table_name='project_members')
+    op.drop_index('ix_inv_user_status', table_name='project_invitations')
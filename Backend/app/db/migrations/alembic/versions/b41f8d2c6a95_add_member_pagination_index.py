@@ -0,0 +1,33 @@
+"""add_member_pagination_index
+
+Revision ID: b41f8d2c6a95
+Revises: 9c5d1e07af24
+Create Date: 2026-08-29 18:21:07.553918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f8d2c6a95'
+down_revision: Union[str, Sequence[str], None] = '9c5d1e07af24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset-paginated member listing: WHERE project_id = :pid
+    # AND (joined_at, id) < (:ts, :id) ORDER BY joined_at DESC, id DESC
+    op.create_index(
+        'ix_pm_project_joined',
+        'project_members',
+        ['project_id', 'joined_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pm_project_joined', table_name='project_members')
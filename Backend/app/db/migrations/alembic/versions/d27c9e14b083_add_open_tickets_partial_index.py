@@ -0,0 +1,36 @@
+"""add_open_tickets_partial_index
+
+Revision ID: d27c9e14b083
+Revises: b41f8d2c6a95
+Create Date: 2026-08-29 19:02:33.847261
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd27c9e14b083'
+down_revision: Union[str, Sequence[str], None] = 'b41f8d2c6a95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Overdue stats: WHERE project_id = :pid AND due_date < now()
+    # AND status != 'done'. Done tickets stay out of the index.
+    # The (project_id, user_id) composite for role checks already
+    # exists via the unique_project_user constraint's backing index.
+    op.create_index(
+        'ix_tickets_open',
+        'tickets',
+        ['project_id', 'due_date'],
+        postgresql_where=sa.text("status != 'done'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_open', table_name='tickets')
@@ -9,6 +9,9 @@ settings = get_settings()
 
 engine = create_async_engine(
     db_settings.POSTGRES_URL(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
     pool_pre_ping=True,
     echo=settings.debug,
     future=True
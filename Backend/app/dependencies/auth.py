@@ -8,6 +8,7 @@ from jose import JWTError, jwt
 
 from app.db.session import get_db
 from app.models.user import User
+from app.core.cache import cache_get_json, cache_set_json
 from app.core.config import get_settings
 
 settings = get_settings()
@@ -43,7 +44,13 @@ async def get_current_user(
             
     except JWTError:
         raise credentials_exception
-    
+
+    # Serve the user from the short-TTL cache to skip the per-request DB hit;
+    # entries are invalidated on user updates
+    cached = await cache_get_json(f"user:{user_id}")
+    if cached is not None:
+        return User.model_validate(cached)
+
     # Query user from database
     try:
         result = await db.execute(
@@ -52,10 +59,11 @@ async def get_current_user(
         user = result.scalar_one_or_none()
     except Exception:
         raise credentials_exception
-    
+
     if user is None:
         raise credentials_exception
-    
+
+    await cache_set_json(f"user:{user_id}", user.model_dump(mode="json"))
     return user
 
 
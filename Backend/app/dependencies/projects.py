@@ -0,0 +1,87 @@
+from typing import Annotated, Callable, FrozenSet
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, status
+
+from app.db.session import SessionDep
+from app.dependencies.auth import CurrentActiveUser
+from app.services.project_service import ProjectService
+
+
+def get_request_cache(request: Request) -> dict:
+    """Per-request memo shared by every ProjectService built for the request.
+
+    Membership/role lookups for the same (project_id, user_id) pair are
+    answered from this dict after the first SELECT, so composed
+    endpoints don't repeat identical authorization queries.
+    """
+    cache = getattr(request.state, "project_memo", None)
+    if cache is None:
+        cache = {}
+        request.state.project_memo = cache
+    return cache
+
+
+async def get_project_service(db: SessionDep, request: Request) -> ProjectService:
+    """Dependency to provide ProjectService instance"""
+    return ProjectService(db, cache=get_request_cache(request))
+
+
+ProjectServiceDep = Annotated[ProjectService, Depends(get_project_service)]
+
+
+async def require_member(
+    project_id: UUID,
+    service: ProjectServiceDep,
+    current_user: CurrentActiveUser
+) -> str:
+    """Require the current user to be a member of the path's project.
+
+    FastAPI caches the dependency per request and the role lookup is
+    memoized, so stacking this with handler-level role logic costs one
+    SELECT at most. Mutating endpoints don't use it — their role check
+    is fused into the statement's WHERE clause.
+    """
+    role = await service.get_member_role(project_id, current_user.id)
+    if role is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    return role
+
+
+def RequireRole(allowed: FrozenSet[str], detail: str) -> Callable:
+    """Build a dependency gating the path's project on a role set.
+
+    The returned dependency reads the role through the cache tiers, so
+    stacking it with other role-aware dependencies in one request costs
+    at most one SELECT. Guarded mutations still fold their authorization
+    into the statement's WHERE clause and don't use this.
+    """
+    async def dependency(
+        project_id: UUID,
+        service: ProjectServiceDep,
+        current_user: CurrentActiveUser
+    ) -> str:
+        # get_member_role normalizes to the plain value string
+        role = await service.get_member_role(project_id, current_user.id)
+        if role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+        return role
+    return dependency
+
+
+require_owner_or_admin = RequireRole(
+    frozenset({"owner", "admin"}), "Only project owners/admins can do this"
+)
+require_admin = RequireRole(
+    frozenset({"admin"}), "Only admins can invite members"
+)
+
+MemberRoleDep = Annotated[str, Depends(require_member)]
+OwnerOrAdminRoleDep = Annotated[str, Depends(require_owner_or_admin)]
+AdminRoleDep = Annotated[str, Depends(require_admin)]
@@ -1,7 +1,13 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from scalar_fastapi import get_scalar_api_reference
 from contextlib import asynccontextmanager
+import asyncio
+import contextlib
+from app.core import rbac_cache
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
 from app.api.v1.router import api_router
@@ -28,8 +34,22 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
         await conn.run_sync(SQLModel.metadata.create_all)
     logger.info("[OK] Database tables created")
+    # Regression guard: endpoints assume a truly async driver; a sync
+    # dialect here would silently push every query through the thread pool
+    logger.info("[OK] Database driver: %s", engine.dialect.driver)
+    if not engine.dialect.is_async:
+        logger.warning("Database dialect %r is not async", engine.dialect.name)
+    # Evict in-process role-cache entries when another worker mutates
+    # a membership; no-op task when Redis is not configured
+    from app.services.project_service import evict_local_role
+    rbac_listener = asyncio.create_task(
+        rbac_cache.listen_for_invalidations(evict_local_role)
+    )
     yield
     # Shutdown
+    rbac_listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await rbac_listener
     await engine.dispose()
     logger.info("[OK] Database connection closed")
 
@@ -39,9 +59,16 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     debug=settings.debug,
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes responses (UUIDs, datetimes, lists) much faster
+    # than the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
+# Compress list/stats payloads; tiny responses skip the gzip overhead.
+# The middleware negotiates via Accept-Encoding and sets Vary itself.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -52,6 +79,56 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Global exception translation: services raise ValueError for bad input
+# and PermissionError for authorization failures; translating them here
+# lets endpoints stay straight-line instead of repeating try/except
+# blocks around every handler body.
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(PermissionError)
+async def permission_error_handler(request: Request, exc: PermissionError):
+    return ORJSONResponse(status_code=403, content={"detail": str(exc)})
+
+
+@app.exception_handler(IntegrityError)
+async def integrity_error_handler(request: Request, exc: IntegrityError):
+    # Unique/foreign-key violations surface as conflicts; the session
+    # dependency has already rolled back by the time this runs
+    return ORJSONResponse(
+        status_code=409,
+        content={"detail": "Conflicts with existing data"}
+    )
+
+
+@app.exception_handler(SQLAlchemyError)
+async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
+    logger.error(
+        "Database error on %s %s: %s",
+        request.method, request.url.path, exc,
+        exc_info=settings.debug
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": "A database error occurred"}
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception):
+    logger.error(
+        "Unhandled error on %s %s: %s",
+        request.method, request.url.path, exc,
+        exc_info=settings.debug
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": "An internal server error occurred"}
+    )
+
+
 # Include routers
 app.include_router(api_router)
 
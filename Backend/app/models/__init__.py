@@ -2,6 +2,7 @@
 
 from app.models.user import User, UserRole
 from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.invitation import ProjectInvitation, InvitationStatus
 from app.models.ticket import Ticket, IssueType, Status, Priority, Resolution
 from app.models.comment import Comment
 from app.models.attachment import Attachment
@@ -10,7 +11,8 @@ from app.models.activity import Activity
 
 __all__ = [
     "User", "UserRole",
-    "Project", "ProjectMember", "ProjectRole", 
+    "Project", "ProjectMember", "ProjectRole",
+    "ProjectInvitation", "InvitationStatus",
     "Ticket", "IssueType", "Status", "Priority", "Resolution",
     "Comment",
     "Attachment",
@@ -1,8 +1,11 @@
 from uuid import uuid4, UUID
+from typing import Optional
 from sqlalchemy.dialects import postgresql
-from sqlmodel import Column, Field, SQLModel
+from sqlmodel import Column, Field, Relationship, SQLModel
 from datetime import datetime, timezone
 
+from app.models.user import User
+
 
 class Attachment(SQLModel, table=True):
     __tablename__ = "attachments"
@@ -20,7 +23,14 @@ class Attachment(SQLModel, table=True):
     # Metadata
     file_size: int = Field(nullable=False)  # Size in bytes
     mime_type: str = Field(max_length=100, nullable=False)  # "image/png", "application/pdf"
+    checksum_sha256: Optional[str] = Field(default=None, max_length=64, nullable=True)  # Computed while streaming to disk
     
     created_at: datetime = Field(
         sa_column=Column(postgresql.TIMESTAMP(timezone=True), default=lambda: datetime.now(timezone.utc))
+    )
+
+    # Uploader relationship - eager-loaded explicitly (selectinload) where needed;
+    # "noload" avoids accidental lazy IO on the async session
+    uploader: Optional[User] = Relationship(
+        sa_relationship_kwargs={"lazy": "noload"}
     )
\ No newline at end of file
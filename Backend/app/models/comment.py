@@ -1,8 +1,11 @@
 from uuid import uuid4, UUID
+from typing import List, Optional
 from sqlalchemy.dialects import postgresql
-from sqlmodel import Column, Field, SQLModel
+from sqlmodel import Column, Field, Relationship, SQLModel
 from datetime import datetime
 
+from app.models.user import User
+
 
 class Comment(SQLModel, table=True):
     __tablename__ = "comments"
@@ -18,4 +21,13 @@ class Comment(SQLModel, table=True):
     )
     updated_at: datetime = Field(
         sa_column=Column(postgresql.TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    )
+
+    # Eager-loaded explicitly (selectinload) where needed; "noload" avoids
+    # accidental lazy IO on the async session
+    author: Optional[User] = Relationship(
+        sa_relationship_kwargs={"lazy": "noload"}
+    )
+    replies: List["Comment"] = Relationship(
+        sa_relationship_kwargs={"lazy": "noload", "order_by": "Comment.created_at"}
     )
\ No newline at end of file
@@ -0,0 +1,64 @@
+from uuid import uuid4, UUID
+from typing import Optional
+from sqlalchemy import Index
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Column, Field, Relationship, SQLModel
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+
+from app.models.project import Project
+from app.models.user import User
+
+
+class InvitationStatus(str, Enum):
+    PENDING = "pending"
+    ACCEPTED = "accepted"
+    DECLINED = "declined"
+    EXPIRED = "expired"
+
+
+def _default_expires_at() -> datetime:
+    """Invitations expire 7 days after being sent"""
+    return datetime.now(timezone.utc) + timedelta(days=7)
+
+
+class ProjectInvitation(SQLModel, table=True):
+    __tablename__ = "project_invitations"
+    __table_args__ = (
+        # The pending-invitations listing filters on exactly this pair
+        Index("ix_inv_user_status", "user_id", "status"),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    project_id: UUID = Field(nullable=False, foreign_key="projects.id")
+    user_id: UUID = Field(nullable=False, foreign_key="users.id")
+    invited_by: UUID = Field(nullable=False, foreign_key="users.id")
+    role: str = Field(default="developer", nullable=False)
+    status: str = Field(default=InvitationStatus.PENDING.value, nullable=False)
+    created_at: datetime = Field(
+        sa_column=Column(postgresql.TIMESTAMP(timezone=True), default=lambda: datetime.now(timezone.utc))
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(postgresql.TIMESTAMP(timezone=True), default=_default_expires_at)
+    )
+
+    # Eager-loaded explicitly (selectinload) where needed; "noload" avoids
+    # accidental lazy IO on the async session
+    project: Optional[Project] = Relationship(
+        sa_relationship_kwargs={"lazy": "noload"}
+    )
+    invited_by_user: Optional[User] = Relationship(
+        sa_relationship_kwargs={
+            "lazy": "noload",
+            "foreign_keys": "[ProjectInvitation.invited_by]",
+        }
+    )
+
+    def is_expired(self) -> bool:
+        """Whether the invitation's expiry timestamp has passed"""
+        if self.expires_at is None:
+            return False
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) > expires_at
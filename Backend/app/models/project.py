@@ -1,8 +1,11 @@
 from uuid import uuid4, UUID
+from typing import Optional
+from sqlalchemy import Index
 from sqlalchemy.dialects import postgresql
-from sqlmodel import Column, Field, SQLModel, UniqueConstraint
+from sqlmodel import Column, Field, Relationship, SQLModel, UniqueConstraint
 from datetime import datetime, timezone
 from app.db.types import project_role_enum
+from app.models.user import User
 from enum import Enum
 
 
@@ -30,12 +33,27 @@ class Project(SQLModel, table=True):
         sa_column=Column(postgresql.TIMESTAMP(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
     )
 
+    # Eager-loaded explicitly (selectinload) where needed; "noload" avoids
+    # accidental lazy IO on the async session
+    owner: Optional[User] = Relationship(
+        sa_relationship_kwargs={
+            "lazy": "noload",
+            "foreign_keys": "[Project.created_by]",
+        }
+    )
+
 
 class ProjectMember(SQLModel, table=True):
     model_config = {"arbitrary_types_allowed": True}
     __tablename__ = "project_members"
     __table_args__ = (
         UniqueConstraint("project_id", "user_id", name="unique_project_user"),
+        # get_user_projects joins on user_id alone; (project_id, user_id)
+        # lookups are already served by the unique constraint's index
+        Index("ix_pm_user", "user_id"),
+        # Keyset-paginated member listing: seek on (joined_at, id)
+        # within a project
+        Index("ix_pm_project_joined", "project_id", "joined_at", "id"),
 )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
@@ -1,8 +1,11 @@
 from uuid import uuid4, UUID
+from typing import Optional
+from sqlalchemy import Index, text
 from sqlalchemy.dialects import postgresql
-from sqlmodel import Column, Field, SQLModel
+from sqlmodel import Column, Field, Relationship, SQLModel
 from datetime import datetime, timezone
 from app.db.types import issue_type_enum, issuestatus_enum, resolution_enum, priority_enum
+from app.models.user import User
 from enum import Enum
 
 class IssueType(str, Enum):
@@ -33,6 +36,16 @@ class Priority(str, Enum):
 class Ticket(SQLModel, table=True):
     model_config = {"arbitrary_types_allowed": True}
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Overdue stats filter open tickets by project and due date; the
+        # partial predicate keeps done tickets (the bulk, long-term) out
+        # of the index entirely
+        Index(
+            "ix_tickets_open",
+            "project_id", "due_date",
+            postgresql_where=text("status != 'done'")
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     key: str = Field(max_length=15, unique=True, nullable=False, index=True)
@@ -58,4 +71,20 @@ class Ticket(SQLModel, table=True):
     )
     resolved_at: datetime = Field(
         sa_column=Column(postgresql.TIMESTAMP(timezone=True), nullable=True)
+    )
+
+    # Eager-loaded explicitly (selectinload) where needed; "noload" avoids
+    # accidental lazy IO on the async session. Both relationships target
+    # users, so each pins its own foreign key.
+    reporter: Optional[User] = Relationship(
+        sa_relationship_kwargs={
+            "lazy": "noload",
+            "foreign_keys": "[Ticket.reporter_id]",
+        }
+    )
+    assignee: Optional[User] = Relationship(
+        sa_relationship_kwargs={
+            "lazy": "noload",
+            "foreign_keys": "[Ticket.assignee_id]",
+        }
     )
\ No newline at end of file
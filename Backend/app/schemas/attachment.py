@@ -23,6 +23,9 @@ class AttachmentResponse(BaseModel):
     created_at: datetime
     mime_type: str
 
+    class Config:
+        from_attributes = True
+
 
 class AttachmentWithUploader(AttachmentResponse):
     """Attachment response schema with uploader info"""
@@ -18,9 +18,12 @@ class CommentResponse(CommentBase):
     author_id: UUID
     parent_id: Optional[UUID] = None
     created_at: datetime
-    updated_at: datetime    
+    updated_at: datetime
     is_edited: bool
 
+    class Config:
+        from_attributes = True
+
 class CommentUpdate(BaseModel):
     content: Optional[str] = Field(None, min_length=1)
 
@@ -1,17 +1,18 @@
+import aiofiles
+import hashlib
 import os
 import shutil
-from uuid import UUID
-from typing import List, Optional
+from uuid import UUID, uuid4
+from typing import AsyncIterator, List, Optional
 from datetime import datetime, timezone
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import UploadFile
 from pathlib import Path
 
 from app.services.base import BaseService
 from app.models.attachment import Attachment
-from app.models.ticket import Ticket
-from app.models.user import User
 
 
 class AttachmentService(BaseService):
@@ -20,6 +21,7 @@ class AttachmentService(BaseService):
     # Configuration
     UPLOAD_DIR = Path("uploads/attachments")
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
+    CHUNK_SIZE = 1024 * 1024  # 1 MB chunks for disk copies
     ALLOWED_MIME_TYPES = {
         "image/jpeg", "image/png", "image/gif", "image/webp",
         "application/pdf",
@@ -43,24 +45,18 @@ class AttachmentService(BaseService):
         uploaded_by: UUID,
         file: UploadFile
     ) -> Attachment:
-        """Upload a file attachment to a ticket"""
-        
-        # Verify ticket exists
-        ticket = await self.session.get(Ticket, ticket_id)
-        if not ticket:
-            raise ValueError(f"Ticket '{ticket_id}' not found")
-        
-        # Verify user exists
-        user = await self.session.get(User, uploaded_by)
-        if not user:
-            raise ValueError(f"User '{uploaded_by}' not found")
-        
+        """Upload a file attachment to a ticket.
+
+        The route verifies the ticket exists and uploaded_by is the
+        authenticated user, so no extra existence SELECTs are issued here.
+        """
+
         # Validate file
         await self._validate_file(file)
         
         # Save file to disk
-        file_path = await self._save_file(file)
-        
+        file_path, checksum = await self._save_file(file)
+
         # Create attachment record
         attachment = Attachment(
             ticket_id=ticket_id,
@@ -70,14 +66,81 @@ class AttachmentService(BaseService):
             file_path=file_path,
             file_url=f"/api/v1/attachments/{file_path.split('/')[-1]}/download",
             file_size=file.size,
-            mime_type=file.content_type
+            mime_type=file.content_type,
+            checksum_sha256=checksum
         )
         
         return await self._add(attachment)
     
+    async def upload_attachment_stream(
+        self,
+        ticket_id: UUID,
+        uploaded_by: UUID,
+        filename: str,
+        content_type: str,
+        stream: AsyncIterator[bytes]
+    ) -> Attachment:
+        """Upload a file attachment from a raw byte stream.
+
+        Unlike upload_attachment, this never buffers the whole file in
+        memory: chunks are written to disk as they arrive. Ticket
+        existence is verified by the route.
+        """
+
+        # Validate metadata before touching the disk
+        if not filename:
+            raise ValueError("Filename is required")
+        if content_type not in self.ALLOWED_MIME_TYPES:
+            raise ValueError(f"File type '{content_type}' is not allowed")
+
+        # Stream chunks straight to disk, enforcing the size limit as we go
+        file_extension = Path(filename).suffix
+        unique_filename = f"{uuid4()}{file_extension}"
+        file_path = self.UPLOAD_DIR / unique_filename
+        file_size = 0
+        # sha256 is hardware-accelerated (SHA-NI) via OpenSSL; hashing the
+        # chunks as they pass through avoids re-reading the file afterwards
+        digest = hashlib.sha256()
+
+        try:
+            async with aiofiles.open(file_path, "wb") as buffer:
+                async for chunk in stream:
+                    file_size += len(chunk)
+                    if file_size > self.MAX_FILE_SIZE:
+                        raise ValueError(
+                            f"File size exceeds maximum allowed size of {self.MAX_FILE_SIZE / (1024*1024):.0f}MB"
+                        )
+                    digest.update(chunk)
+                    await buffer.write(chunk)
+        except Exception:
+            # Don't leave partial files behind
+            if file_path.exists():
+                file_path.unlink()
+            raise
+
+        # Create attachment record
+        attachment = Attachment(
+            ticket_id=ticket_id,
+            uploaded_by=uploaded_by,
+            filename=unique_filename,
+            original_filename=filename,
+            file_path=str(file_path),
+            file_url=f"/api/v1/attachments/{unique_filename}/download",
+            file_size=file_size,
+            mime_type=content_type,
+            checksum_sha256=digest.hexdigest()
+        )
+
+        return await self._add(attachment)
+
     async def get_attachment(self, attachment_id: UUID) -> Optional[Attachment]:
-        """Get attachment by ID"""
-        return await self._get(attachment_id)
+        """Get attachment by ID with uploader preloaded"""
+        query = select(Attachment).options(
+            selectinload(Attachment.uploader)
+        ).where(Attachment.id == attachment_id)
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
     
     async def get_ticket_attachments(
         self,
@@ -85,14 +148,11 @@ class AttachmentService(BaseService):
         skip: int = 0,
         limit: int = 50
     ) -> List[Attachment]:
-        """Get all attachments for a ticket"""
-        
-        # Verify ticket exists
-        ticket = await self.session.get(Ticket, ticket_id)
-        if not ticket:
-            raise ValueError(f"Ticket '{ticket_id}' not found")
-        
-        query = select(Attachment).where(
+        """Get all attachments for a ticket (existence checked by the route)"""
+
+        query = select(Attachment).options(
+            selectinload(Attachment.uploader)
+        ).where(
             Attachment.ticket_id == ticket_id
         ).order_by(Attachment.created_at.desc()).offset(skip).limit(limit)
         
@@ -154,22 +214,24 @@ class AttachmentService(BaseService):
         if not file.filename:
             raise ValueError("Filename is required")
     
-    async def _save_file(self, file: UploadFile) -> str:
-        """Save uploaded file to disk and return path"""
-        
+    async def _save_file(self, file: UploadFile) -> tuple:
+        """Save uploaded file to disk, returning (path, sha256 checksum)"""
+
         # Generate unique filename
-        from uuid import uuid4
         file_extension = Path(file.filename).suffix
         unique_filename = f"{uuid4()}{file_extension}"
         file_path = self.UPLOAD_DIR / unique_filename
-        
+
         try:
-            # Save file
-            with open(file_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
-            
-            return str(file_path)
+            # Copy in chunks via aiofiles, hashing while writing, so the
+            # file is never fully buffered in memory nor read twice
+            digest = hashlib.sha256()
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while chunk := await file.read(self.CHUNK_SIZE):
+                    digest.update(chunk)
+                    await buffer.write(chunk)
+
+            return str(file_path), digest.hexdigest()
         except Exception as e:
             raise ValueError(f"Failed to save file: {str(e)}")
     
@@ -181,7 +243,9 @@ class AttachmentService(BaseService):
     ) -> List[Attachment]:
         """Get all attachments uploaded by a user"""
         
-        query = select(Attachment).where(
+        query = select(Attachment).options(
+            selectinload(Attachment.uploader)
+        ).where(
             Attachment.uploaded_by == user_id
         ).order_by(Attachment.created_at.desc()).offset(skip).limit(limit)
         
@@ -1,18 +1,36 @@
 from datetime import datetime, timezone
-from fastapi import BackgroundTasks
-from sqlalchemy import select, or_
+from sqlalchemy import bindparam, select, or_
 from app.services.base import BaseService
 from app.models import User
 from sqlalchemy.ext.asyncio import AsyncSession
 from email_validator import validate_email, EmailNotValidError
 
-from app.utils.access_token import create_access_token, get_password_hash, verify_password
+from app.core.cache import publish_event
+from app.utils.access_token import (
+    create_user_token,
+    get_password_hash_async,
+    verify_password_async,
+)
+
+# Login statements built once at import so SQLAlchemy's compile work is
+# done ahead of the hot path. role/permissions live directly on the users
+# row (no relationships), so these single-row SELECTs load everything the
+# login flow needs. An email always contains '@' while usernames never
+# should, so the lookup probes exactly one unique index instead of OR-ing
+# across both columns.
+_LOGIN_BY_EMAIL = select(User).where(User.email == bindparam("identifier"))
+_LOGIN_BY_USERNAME = select(User).where(User.username == bindparam("identifier"))
+
+
+# Stream consumed by the side-effect worker (welcome emails, audit rows);
+# publishing here keeps SMTP and audit latency out of the web process
+AUTH_EVENTS_STREAM = "events:auth"
+
 
 class AuthService(BaseService):
-    def __init__(self, model: User, session: AsyncSession, tasks: BackgroundTasks):
+    def __init__(self, model: User, session: AsyncSession):
         self.model = model
         self.session = session
-        self.tasks = tasks
     
     async def _add_user(self, data: dict) -> tuple:
         # Extract password before unpacking
@@ -51,26 +69,27 @@ class AuthService(BaseService):
         user = self.model(
             **data,
             role="viewer",  # Always start as viewer
-            hashed_password=get_password_hash(password)
+            hashed_password=await get_password_hash_async(password)
         )
         
         user = await self._add(user)
-        token = create_access_token(data={
-            "id": str(user.id),
+        await publish_event(AUTH_EVENTS_STREAM, {
+            "type": "registered",
+            "user_id": str(user.id),
             "email": user.email
         })
+        token = create_user_token(str(user.id), user.email)
         return user, token
-    
+
     async def login_user(self, username_or_email: str, password: str) -> tuple:
         # Validate inputs
         if not username_or_email or not password:
             raise ValueError("Username/email and password are required")
         
-        # Find user by email OR username
+        # Find user by email or username (precompiled statements)
+        query = _LOGIN_BY_EMAIL if "@" in username_or_email else _LOGIN_BY_USERNAME
         result = await self.session.execute(
-            select(User).where(
-                or_(User.email == username_or_email, User.username == username_or_email)
-            )
+            query, {"identifier": username_or_email}
         )
         user = result.scalar_one_or_none()
         
@@ -81,16 +100,18 @@ class AuthService(BaseService):
         if not user.is_active:
             raise ValueError("Account is inactive")
         
-        # Verify password
-        if not verify_password(password, user.hashed_password):
+        # Verify password (runs on the dedicated hashing thread pool)
+        if not await verify_password_async(password, user.hashed_password):
             raise ValueError("Invalid email or password")
         
         # Update last login
         user.last_login = datetime.now(timezone.utc)
         user = await self._update(user)
-        
-        token = create_access_token(data={
-            "id": str(user.id),
-            "email": user.email
+
+        await publish_event(AUTH_EVENTS_STREAM, {
+            "type": "login",
+            "user_id": str(user.id),
+            "at": user.last_login.isoformat()
         })
+        token = create_user_token(str(user.id), user.email)
         return user, token
\ No newline at end of file
@@ -1,13 +1,30 @@
 from uuid import UUID
-from typing import List, Optional
-from sqlalchemy import select
+from typing import AsyncIterator, Dict, List, Optional
+from cachetools import TTLCache
+from sqlalchemy import literal, select
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.base import BaseService
 from app.models.comment import Comment
 from app.models.ticket import Ticket
+from app.models.user import User
 from datetime import datetime, timezone
 
 
+# Replies pages are re-fetched aggressively by refresh polling; a 5s TTL
+# absorbs those repeats while keeping threads near-realtime. Rows are
+# detached (expire_on_commit=False) so caching them across requests is
+# safe. Invalidated on reply creation and comment deletion.
+_replies_cache: TTLCache = TTLCache(maxsize=5_000, ttl=5)
+
+
+def _invalidate_replies(parent_id: UUID) -> None:
+    """Drop every cached replies page for a parent comment"""
+    for key in [key for key in _replies_cache if key[0] == parent_id]:
+        _replies_cache.pop(key, None)
+
+
 class CommentService(BaseService):
     """Comment service for business logic"""
     
@@ -16,19 +33,17 @@ class CommentService(BaseService):
         self.model = Comment
 
     async def create_comment(
-        self, 
-        ticket_id: UUID, 
-        author_id: UUID, 
+        self,
+        ticket_id: UUID,
+        author_id: UUID,
         content: str,
         parent_id: Optional[UUID] = None
     ) -> Comment:
         """Create a new comment on a ticket"""
-        
-        # Verify ticket exists
-        ticket = await self.session.get(Ticket, ticket_id)
-        if not ticket:
-            raise ValueError(f"Ticket '{ticket_id}' not found")
-        
+
+        # Verify ticket (and parent, when replying) with one round trip
+        await self._validate_ticket_and_parent(ticket_id, parent_id)
+
         # Create comment
         new_comment = Comment(
             ticket_id=ticket_id,
@@ -36,24 +51,68 @@ class CommentService(BaseService):
             content=content,
             parent_id=parent_id
         )
-        return await self._add(new_comment)
+        comment = await self._add(new_comment)
+        if parent_id is not None:
+            _invalidate_replies(parent_id)
+        return comment
+
+    async def _validate_ticket_and_parent(
+        self,
+        ticket_id: UUID,
+        parent_id: Optional[UUID]
+    ) -> None:
+        """Check ticket existence and parent validity in a single query.
+
+        The ticket-exists probe and the parent lookup are independent
+        subqueries, so fusing them costs one round trip instead of two.
+        """
+
+        ticket_exists = select(Ticket.id).where(Ticket.id == ticket_id).exists()
+
+        if parent_id is None:
+            result = await self.session.execute(select(ticket_exists))
+            if not result.scalar():
+                raise ValueError(f"Ticket '{ticket_id}' not found")
+            return
+
+        parent_ticket_id = select(Comment.ticket_id).where(
+            Comment.id == parent_id
+        ).scalar_subquery()
+
+        result = await self.session.execute(select(ticket_exists, parent_ticket_id))
+        ticket_ok, parent_tid = result.one()
+
+        if not ticket_ok:
+            raise ValueError(f"Ticket '{ticket_id}' not found")
+        if parent_tid is None:
+            raise ValueError(f"Parent comment '{parent_id}' not found")
+        if parent_tid != ticket_id:
+            raise ValueError("Parent comment belongs to a different ticket")
 
     async def get_ticket_comments(
         self,
         ticket_id: UUID,
         skip: int = 0,
         limit: int = 20,
-        parent_id: Optional[UUID] = None
+        parent_id: Optional[UUID] = None,
+        cursor: Optional[datetime] = None
     ) -> List[Comment]:
-        """Get comments for a ticket (top-level or replies)"""
-        
-        # Verify ticket exists
-        ticket = await self.session.get(Ticket, ticket_id)
-        if not ticket:
-            raise ValueError(f"Ticket '{ticket_id}' not found")
-        
-        # Base query
-        query = select(Comment).where(
+        """Get comments for a ticket (top-level or replies).
+
+        The WHERE ticket_id clause already scopes the result, so no
+        separate ticket-existence probe is issued; an unknown ticket just
+        yields an empty page. When a cursor (created_at of the last item
+        seen) is given it replaces OFFSET: the page starts right after
+        the cursor via an index seek, so deep pages cost the same as the
+        first one.
+        """
+
+        # Base query; author and replies are eager-loaded so a page costs
+        # three SQL round-trips regardless of its size
+        query = select(Comment).options(
+            selectinload(Comment.author),
+            selectinload(Comment.replies)
+        ).where(
             Comment.ticket_id == ticket_id
         )
         
@@ -66,16 +125,50 @@ class CommentService(BaseService):
         
         # Order by creation date
         query = query.order_by(Comment.created_at)
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
+
+        # Apply pagination: keyset when a cursor is given, OFFSET otherwise
+        if cursor is not None:
+            query = query.where(Comment.created_at > cursor).limit(limit)
+        else:
+            query = query.offset(skip).limit(limit)
+
         result = await self.session.execute(query)
         return result.scalars().all()
 
     async def get_comment_by_id(self, comment_id: UUID) -> Optional[Comment]:
-        """Get a comment by ID"""
-        return await self._get(comment_id)
+        """Get a comment by ID with author and replies preloaded"""
+        query = select(Comment).options(
+            selectinload(Comment.author),
+            selectinload(Comment.replies)
+        ).where(Comment.id == comment_id)
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_comment_for_ticket(
+        self,
+        comment_id: UUID,
+        ticket_id: UUID
+    ) -> Optional[Comment]:
+        """Get a comment scoped to a ticket, with author and replies.
+
+        Folding the ticket check into the WHERE clause lets callers skip
+        the separate ticket-existence SELECT; None covers both "no such
+        ticket" and "no such comment". Note that overlapping the two
+        lookups with asyncio.gather is not an option: an AsyncSession
+        owns a single connection and cannot run queries concurrently, so
+        fusing them into one statement is how the round trip is saved.
+        """
+        query = select(Comment).options(
+            selectinload(Comment.author),
+            selectinload(Comment.replies)
+        ).where(
+            Comment.id == comment_id,
+            Comment.ticket_id == ticket_id
+        )
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
 
     async def update_comment(
         self,
@@ -115,29 +208,146 @@ class CommentService(BaseService):
         # Check permissions
         if comment.author_id != user_id and not is_admin:
             raise PermissionError("You can only delete your own comments")
-        
+
         await self._delete(comment)
+        _invalidate_replies(comment.id)
+        if comment.parent_id is not None:
+            _invalidate_replies(comment.parent_id)
         return True
 
     async def get_comment_replies(
         self,
         parent_id: UUID,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        cursor: Optional[datetime] = None
     ) -> List[Comment]:
-        """Get all replies to a comment"""
-        
-        # Verify parent comment exists
-        parent = await self._get(parent_id)
-        if not parent:
-            raise ValueError(f"Parent comment '{parent_id}' not found")
-        
+        """Get all replies to a comment (parent validity checked by callers)"""
+
+        cache_key = (parent_id, skip, limit, cursor)
+        cached = _replies_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         query = select(Comment).where(
             Comment.parent_id == parent_id
-        ).order_by(Comment.created_at).offset(skip).limit(limit)
-        
+        ).order_by(Comment.created_at)
+
+        if cursor is not None:
+            query = query.where(Comment.created_at > cursor).limit(limit)
+        else:
+            query = query.offset(skip).limit(limit)
+
         result = await self.session.execute(query)
-        return result.scalars().all()
+        replies = result.scalars().all()
+        _replies_cache[cache_key] = replies
+        return replies
+
+    async def get_authors_by_ids(self, author_ids: List[UUID]) -> Dict[UUID, User]:
+        """Load a batch of authors in one IN-query, keyed by id"""
+
+        if not author_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(User).where(User.id.in_(author_ids))
+        )
+        return {user.id: user for user in result.scalars().all()}
+
+    async def get_replies_for_parents(
+        self,
+        parent_ids: List[UUID]
+    ) -> Dict[UUID, List[Comment]]:
+        """Load replies for a batch of parent comments in one IN-query.
+
+        Returns a dict bucketing replies by parent_id so callers can zip
+        them back onto a page of top-level comments without issuing one
+        replies query per comment.
+        """
+
+        if not parent_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(Comment).where(
+                Comment.parent_id.in_(parent_ids)
+            ).order_by(Comment.created_at)
+        )
+
+        replies_by_parent: Dict[UUID, List[Comment]] = {}
+        for reply in result.scalars().all():
+            replies_by_parent.setdefault(reply.parent_id, []).append(reply)
+        return replies_by_parent
+
+    async def get_comment_tree(
+        self,
+        ticket_id: UUID,
+        max_depth: int = 5
+    ) -> List[Comment]:
+        """Get a ticket's full comment tree with one recursive CTE.
+
+        Walking the thread level by level costs one round trip per depth;
+        WITH RECURSIVE returns every comment down to max_depth in a
+        single query. Children are bucketed onto their parents' replies
+        collection in Python (set_committed_value, so the session does
+        not see the assignment as a mutation) and the top-level comments
+        are returned.
+        """
+
+        tree = (
+            select(Comment, literal(0).label("depth"))
+            .where(
+                Comment.ticket_id == ticket_id,
+                Comment.parent_id.is_(None)
+            )
+            .cte("comment_tree", recursive=True)
+        )
+        child = aliased(Comment)
+        tree = tree.union_all(
+            select(child, tree.c.depth + 1).where(
+                child.parent_id == tree.c.id,
+                tree.c.depth < max_depth
+            )
+        )
+
+        node = aliased(Comment, tree)
+        result = await self.session.execute(
+            select(node).order_by(tree.c.depth, tree.c.created_at)
+        )
+        comments = result.scalars().all()
+
+        by_id: Dict[UUID, Comment] = {}
+        roots: List[Comment] = []
+        for comment in comments:
+            set_committed_value(comment, "replies", [])
+            by_id[comment.id] = comment
+            if comment.parent_id is None:
+                roots.append(comment)
+            elif comment.parent_id in by_id:
+                by_id[comment.parent_id].replies.append(comment)
+
+        return roots
+
+    async def iter_comment_replies(
+        self,
+        parent_id: UUID,
+        skip: int = 0,
+        limit: int = 20
+    ) -> AsyncIterator[Comment]:
+        """Iterate replies via a server-side streamed result.
+
+        Unlike get_comment_replies this never materializes the page: rows
+        arrive from session.stream() one at a time, so callers can
+        serialize incrementally on large limits.
+        """
+
+        query = select(Comment).where(
+            Comment.parent_id == parent_id
+        ).order_by(Comment.created_at).offset(skip).limit(limit)
+
+        result = await self.session.stream(query)
+        async for reply in result.scalars():
+            yield reply
 
     async def get_comment_thread(self, parent_id: UUID) -> Optional[dict]:
         """Get a comment with all its replies"""
@@ -1,19 +1,44 @@
 from uuid import UUID
-from typing import List, Optional
-from sqlalchemy import select, and_
+from typing import List, Optional, Tuple
+from cachetools import TTLCache
+from datetime import datetime
+from sqlalchemy import and_, delete, select, tuple_, update
+from sqlalchemy.orm import aliased, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import rbac_cache
 from app.services.base import BaseService
 from app.models.project import Project, ProjectMember, ProjectRole
 from app.models.user import User
 
+# Process-wide L1 for role lookups, shared across requests. Membership
+# rarely changes, so every authenticated write saves its authorization
+# round-trip on a hit; mutations invalidate eagerly here, in the shared
+# Redis L2, and (via pub/sub) in every other worker's L1.
+_role_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def evict_local_role(project_id: UUID, user_id: UUID) -> None:
+    """Drop an L1 entry; callback for the cross-worker invalidation feed"""
+    _role_cache.pop((project_id, user_id), None)
+
+
+def _role_value(role) -> Optional[str]:
+    """Normalize a role to its plain value string"""
+    if role is None:
+        return None
+    return role.value if hasattr(role, 'value') else role
+
 
 class ProjectService(BaseService):
     """Project service for business logic"""
     
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: Optional[dict] = None):
         self.session = session
         self.model = Project
+        # Per-request memo for role lookups, shared across service
+        # instances when injected via dependencies.projects
+        self._role_memo = cache if cache is not None else {}
     
     async def create_project(self, data: dict, created_by: UUID) -> Project:
         """Create a new project"""
@@ -54,16 +79,68 @@ class ProjectService(BaseService):
     async def get_project(self, project_id: UUID) -> Optional[Project]:
         """Get project by ID"""
         return await self._get(project_id)
-    
-    async def get_user_projects(self, user_id: UUID) -> List[Project]:
-        """Get all projects where user is a member"""
+
+    async def get_project_with_role(
+        self, project_id: UUID, user_id: UUID
+    ) -> Tuple[Optional[Project], Optional[str]]:
+        """Get a project and the caller's role in it with one round-trip.
+
+        The membership row rides along as a LEFT JOIN, so callers can
+        still tell a missing project (None, None) from an existing one
+        the user doesn't belong to (project, None).
+        """
         result = await self.session.execute(
+            select(Project, ProjectMember.role)
+            .outerjoin(
+                ProjectMember,
+                and_(
+                    ProjectMember.project_id == Project.id,
+                    ProjectMember.user_id == user_id
+                )
+            )
+            .where(Project.id == project_id)
+        )
+        row = result.first()
+        if row is None:
+            return None, None
+        project, role = row[0], _role_value(row[1])
+        # Feed the role tiers so later checks in the request are free
+        self._role_memo[(project_id, user_id)] = role
+        if role is not None:
+            _role_cache[(project_id, user_id)] = role
+        return project, role
+    
+    async def get_user_projects(
+        self,
+        user_id: UUID,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        limit: Optional[int] = None
+    ) -> List[Project]:
+        """Get projects where user is a member, newest first.
+
+        A single JOIN against project_members with the owner eager-loaded
+        (one extra IN-query), so the listing stays at O(1) statements
+        however many projects the user belongs to. Pagination is keyset
+        on (created_at, id): the cursor is the last row of the previous
+        page, so the DB seeks straight to the page instead of scanning
+        past an OFFSET. Callers pass limit+1 to detect a next page.
+        """
+        stmt = (
             select(Project)
             .join(ProjectMember, Project.id == ProjectMember.project_id)
             .where(ProjectMember.user_id == user_id)
             .where(Project.is_archived == False)
+            .options(selectinload(Project.owner))
+            .order_by(Project.created_at.desc(), Project.id.desc())
         )
-        return result.scalars().all()
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(Project.created_at, Project.id) < cursor
+            )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().unique().all()
     
     async def get_all_projects(self) -> List[Project]:
         """Get all projects (admin only)"""
@@ -139,14 +216,63 @@ class ProjectService(BaseService):
         self.session.add(member)
         await self.session.commit()
         await self.session.refresh(member)
+        await self._forget_role(project_id, user_id)
         return member
-    
-    async def get_project_members(self, project_id: UUID) -> List[ProjectMember]:
-        """Get all members of a project"""
-        result = await self.session.execute(
-            select(ProjectMember).where(ProjectMember.project_id == project_id)
+
+    async def get_project_members(
+        self,
+        project_id: UUID,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        limit: Optional[int] = None
+    ) -> List[ProjectMember]:
+        """Get members of a project, newest first (keyset paginated)"""
+        stmt = (
+            select(ProjectMember)
+            .where(ProjectMember.project_id == project_id)
+            .order_by(ProjectMember.joined_at.desc(), ProjectMember.id.desc())
         )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(ProjectMember.joined_at, ProjectMember.id) < cursor
+            )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def get_member_with_caller_role(
+        self, project_id: UUID, user_id: UUID, caller_id: UUID
+    ) -> Tuple[Optional[ProjectMember], Optional[str]]:
+        """Get a target member and the caller's own role in one round-trip.
+
+        Selects from the caller's membership row with the target LEFT
+        JOINed, so (None, None) means the caller isn't a member while
+        (None, role) means the target isn't.
+        """
+        target = aliased(ProjectMember)
+        result = await self.session.execute(
+            select(target, ProjectMember.role)
+            .select_from(ProjectMember)
+            .outerjoin(
+                target,
+                and_(
+                    target.project_id == ProjectMember.project_id,
+                    target.user_id == user_id
+                )
+            )
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id == caller_id
+            )
+        )
+        row = result.first()
+        if row is None:
+            return None, None
+        member, caller_role = row[0], _role_value(row[1])
+        self._role_memo[(project_id, caller_id)] = caller_role
+        if caller_role is not None:
+            _role_cache[(project_id, caller_id)] = caller_role
+        return member, caller_role
     
     async def update_member_role(
         self, 
@@ -170,6 +296,7 @@ class ProjectService(BaseService):
         member.role = role
         await self.session.commit()
         await self.session.refresh(member)
+        await self._forget_role(project_id, user_id)
         return member
     
     async def remove_member(self, project_id: UUID, user_id: UUID) -> None:
@@ -189,24 +316,209 @@ class ProjectService(BaseService):
         # Don't allow removing the owner
         if member.role == ProjectRole.OWNER:
             raise ValueError("Cannot remove project owner")
-        
+
         await self.session.delete(member)
         await self.session.commit()
+        await self._forget_role(project_id, user_id)
     
-    async def is_member(self, project_id: UUID, user_id: UUID) -> bool:
-        """Check if user is a member of project"""
-        result = await self.session.execute(
-            select(ProjectMember).where(
-                and_(
-                    ProjectMember.project_id == project_id,
-                    ProjectMember.user_id == user_id
+    async def _forget_role(self, project_id: UUID, user_id: UUID) -> None:
+        """Drop a cached role from every tier after a membership mutation"""
+        key = (project_id, user_id)
+        self._role_memo.pop(key, None)
+        _role_cache.pop(key, None)
+        await rbac_cache.invalidate(project_id, user_id)
+
+    def _actor_has_role(self, project_id: UUID, actor_id: UUID, roles: Tuple[ProjectRole, ...]):
+        """EXISTS predicate asserting the actor holds one of the given roles.
+
+        Embedding this in a mutation's WHERE clause folds the
+        authorization SELECT into the statement itself, so the happy
+        path costs one round trip instead of two.
+        """
+        return (
+            select(ProjectMember.id)
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id == actor_id,
+                ProjectMember.role.in_(roles)
+            )
+            .exists()
+        )
+
+    async def update_project_if(
+        self,
+        project_id: UUID,
+        actor_id: UUID,
+        data: dict,
+        roles: Tuple[ProjectRole, ...] = (ProjectRole.OWNER,)
+    ) -> Optional[Project]:
+        """Update a project only if the actor holds one of the roles.
+
+        Returns the updated project, or None when either the project does
+        not exist or the actor lacks the role; callers disambiguate with
+        a single SELECT on that failure path only.
+        """
+        values = {k: v for k, v in data.items() if v is not None}
+        if not values:
+            # Nothing to change: just re-read the row under the same guard
+            result = await self.session.execute(
+                select(Project).where(
+                    Project.id == project_id,
+                    self._actor_has_role(project_id, actor_id, roles)
                 )
             )
+            return result.scalar_one_or_none()
+
+        result = await self.session.execute(
+            update(Project)
+            .where(
+                Project.id == project_id,
+                self._actor_has_role(project_id, actor_id, roles)
+            )
+            .values(**values)
+            .returning(Project)
         )
-        return result.scalar_one_or_none() is not None
-    
-    async def get_member_role(self, project_id: UUID, user_id: UUID) -> Optional[ProjectRole]:
-        """Get user's role in project"""
+        project = result.scalar_one_or_none()
+        if project is not None:
+            await self.session.commit()
+        return project
+
+    async def archive_project_if(
+        self,
+        project_id: UUID,
+        actor_id: UUID,
+        roles: Tuple[ProjectRole, ...]
+    ) -> bool:
+        """Archive a project only if the actor holds one of the roles"""
+        result = await self.session.execute(
+            update(Project)
+            .where(
+                Project.id == project_id,
+                self._actor_has_role(project_id, actor_id, roles)
+            )
+            .values(is_archived=True)
+        )
+        if result.rowcount:
+            await self.session.commit()
+        return bool(result.rowcount)
+
+    async def update_member_role_if(
+        self,
+        project_id: UUID,
+        user_id: UUID,
+        role: ProjectRole,
+        actor_id: UUID,
+        roles: Tuple[ProjectRole, ...] = (ProjectRole.OWNER,)
+    ) -> Optional[ProjectMember]:
+        """Update a member's role only if the actor holds one of the roles"""
+        result = await self.session.execute(
+            update(ProjectMember)
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id == user_id,
+                self._actor_has_role(project_id, actor_id, roles)
+            )
+            .values(role=role)
+            .returning(ProjectMember)
+        )
+        member = result.scalar_one_or_none()
+        if member is not None:
+            await self.session.commit()
+            await self._forget_role(project_id, user_id)
+        return member
+
+    async def update_member_role_by_identifier(
+        self,
+        project_id: UUID,
+        member_id: str,
+        role: ProjectRole,
+        actor_id: UUID,
+        roles: Tuple[ProjectRole, ...] = (ProjectRole.OWNER,)
+    ) -> Optional[ProjectMember]:
+        """Update a member's role, addressing the member by UUID or username.
+
+        A username resolves inside the UPDATE itself via an IN-subquery
+        on users, so the lookup and the mutation share one round-trip
+        instead of SELECT-then-UPDATE.
+        """
+        try:
+            user_id = UUID(member_id)
+        except ValueError:
+            user_id = None
+        if user_id is not None:
+            return await self.update_member_role_if(
+                project_id, user_id, role, actor_id, roles
+            )
+
+        result = await self.session.execute(
+            update(ProjectMember)
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id.in_(
+                    select(User.id).where(User.username == member_id)
+                ),
+                self._actor_has_role(project_id, actor_id, roles)
+            )
+            .values(role=role)
+            .returning(ProjectMember)
+        )
+        member = result.scalar_one_or_none()
+        if member is not None:
+            await self.session.commit()
+            await self._forget_role(project_id, member.user_id)
+        return member
+
+    async def remove_member_if(
+        self,
+        project_id: UUID,
+        user_id: UUID,
+        actor_id: UUID,
+        roles: Tuple[ProjectRole, ...] = (ProjectRole.OWNER,)
+    ) -> bool:
+        """Remove a member (never the owner) if the actor holds one of the roles"""
+        result = await self.session.execute(
+            delete(ProjectMember)
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id == user_id,
+                ProjectMember.role != ProjectRole.OWNER,
+                self._actor_has_role(project_id, actor_id, roles)
+            )
+        )
+        if result.rowcount:
+            await self.session.commit()
+            await self._forget_role(project_id, user_id)
+        return bool(result.rowcount)
+
+    async def is_member(self, project_id: UUID, user_id: UUID) -> bool:
+        """Check if user is a member of project"""
+        return await self.get_member_role(project_id, user_id) is not None
+
+    async def get_member_role(self, project_id: UUID, user_id: UUID) -> Optional[str]:
+        """Get user's role in project, as its plain value string.
+
+        Normalizing to str at the service boundary means callers never
+        need the `.value if hasattr(...)` shim, and every cache tier
+        stores the same representation. ProjectRole is a str-enum, so
+        comparisons against role literals behave identically.
+
+        Two cache tiers answer before the database does: the per-request
+        memo (exact within a request) and the process-wide TTL cache
+        (shared across requests, invalidated on mutation).
+        """
+        key = (project_id, user_id)
+        if key in self._role_memo:
+            return self._role_memo[key]
+        cached = _role_cache.get(key)
+        if cached is not None:
+            self._role_memo[key] = cached
+            return cached
+        shared = await rbac_cache.get_role(project_id, user_id)
+        if shared is not None:
+            self._role_memo[key] = shared
+            _role_cache[key] = shared
+            return shared
+
         result = await self.session.execute(
             select(ProjectMember).where(
                 and_(
@@ -216,4 +528,12 @@ class ProjectService(BaseService):
             )
         )
         member = result.scalar_one_or_none()
-        return member.role if member else None
+        role = _role_value(member.role) if member else None
+        self._role_memo[key] = role
+        if role is not None:
+            # Only positive results are shared across requests; a
+            # non-membership answer stays request-local so a freshly
+            # invited user isn't locked out for a TTL
+            _role_cache[key] = role
+            await rbac_cache.set_role(project_id, user_id, role)
+        return role
@@ -1,12 +1,13 @@
 from uuid import UUID
 from typing import List, Optional
-from sqlalchemy import select, and_, func, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, and_, func, or_, update
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.base import BaseService
 from app.models.ticket import Priority, Status, Ticket, IssueType
-from app.models.project import Project
+from app.models.project import Project, ProjectMember, ProjectRole
 from app.models.user import User
+from app.utils.ticket_cache import invalidate_ticket
 from datetime import datetime, timezone
 
 
@@ -72,12 +73,16 @@ class TicketService(BaseService):
         limit: int = 20,
     ) -> List[Ticket]:
         """Get tickets with filtering and pagination"""
-        # Base query
+        # Base query; selectinload batches reporters/assignees for the
+        # whole page into one extra IN() SELECT instead of N+1 lookups
         query = select(Ticket).where(
             and_(
                 Ticket.project_id == project_id,
                 Ticket.is_archived is not True
             )
+        ).options(
+            selectinload(Ticket.reporter),
+            selectinload(Ticket.assignee)
         )
         
         # Apply filters if provided
@@ -111,13 +116,17 @@ class TicketService(BaseService):
         sort_order: str = "desc"
     ) -> tuple[List[Ticket], int]:
         """Search and filter tickets with comprehensive options"""
-        
-        # Base query
+
+        # Base query; selectinload batches reporters/assignees for the
+        # whole page into one extra IN() SELECT instead of N+1 lookups
         query = select(Ticket).where(
             and_(
                 Ticket.project_id == project_id,
                 Ticket.is_archived is not True
             )
+        ).options(
+            selectinload(Ticket.reporter),
+            selectinload(Ticket.assignee)
         )
         
         # Keyword search (searches title and description)
@@ -207,52 +216,125 @@ class TicketService(BaseService):
         """Get a ticket by ID"""
         return await self._get(ticket_id)
     
-    async def update_ticket(self, ticket_id: UUID, data: dict) -> Ticket:
-        """Update ticket details"""
-        ticket = await self._get(ticket_id)
-        if not ticket:
-            raise ValueError("Ticket not found")
-        
+    def _actor_can_edit(self, actor_id: UUID):
+        """Predicate: actor reports, is assigned, or holds an editing role.
+
+        The membership EXISTS correlates against the ticket row being
+        mutated, folding the permission SELECT into the statement's
+        WHERE clause so the happy path costs one round trip.
+        """
+        return or_(
+            Ticket.reporter_id == actor_id,
+            Ticket.assignee_id == actor_id,
+            select(ProjectMember.id)
+            .where(
+                ProjectMember.project_id == Ticket.project_id,
+                ProjectMember.user_id == actor_id,
+                ProjectMember.role.in_(
+                    (ProjectRole.OWNER, ProjectRole.ADMIN, ProjectRole.DEVELOPER)
+                )
+            )
+            .correlate(Ticket)
+            .exists()
+        )
+
+    def _is_project_member(self, user_id: UUID):
+        """Correlated EXISTS: user belongs to the mutated ticket's project"""
+        return (
+            select(ProjectMember.id)
+            .where(
+                ProjectMember.project_id == Ticket.project_id,
+                ProjectMember.user_id == user_id
+            )
+            .correlate(Ticket)
+            .exists()
+        )
+
+    async def _guarded_update(self, ticket_id: UUID, guard, values: dict) -> Optional[Ticket]:
+        """Run one UPDATE ... WHERE guard ... RETURNING for a ticket.
+
+        None means the ticket is missing or the guard failed; callers
+        diagnose which on that (cold) path only.
+        """
+        result = await self.session.execute(
+            update(Ticket)
+            .where(Ticket.id == ticket_id, guard)
+            .values(**values)
+            .returning(Ticket)
+        )
+        ticket = result.scalar_one_or_none()
+        if ticket is not None:
+            await self.session.commit()
+        return ticket
+
+    async def update_ticket_if_permitted(
+        self, ticket_id: UUID, actor_id: UUID, data: dict
+    ) -> Optional[Ticket]:
+        """Update ticket details if the actor may edit it.
+
+        Replaces the old SELECT-check-UPDATE sequence with a single
+        guarded statement.
+        """
         # Update only allowed fields
         allowed_fields = ['title', 'description', 'type', 'priority', 'due_date']
-        for key, value in data.items():
-            if key in allowed_fields and value is not None:
-                setattr(ticket, key, value)
-        
-        return await self._update(ticket)
-    
-    async def update_ticket_status(self, ticket_id: UUID, status: Status, resolution: Optional[str] = None) -> Ticket:
-        ticket = await self._get(ticket_id)
-        if not ticket:
-            raise ValueError("Ticket not found")
-        
-        ticket.status = status
+        values = {
+            key: value for key, value in data.items()
+            if key in allowed_fields and value is not None
+        }
+        if not values:
+            # Nothing to change: answer the permission question alone
+            result = await self.session.execute(
+                select(Ticket).where(
+                    Ticket.id == ticket_id,
+                    self._actor_can_edit(actor_id)
+                )
+            )
+            return result.scalar_one_or_none()
+        return await self._guarded_update(
+            ticket_id, self._actor_can_edit(actor_id), values
+        )
+
+    async def update_ticket_status_if_permitted(
+        self,
+        ticket_id: UUID,
+        actor_id: UUID,
+        status: Status,
+        resolution: Optional[str] = None
+    ) -> Optional[Ticket]:
+        """Change status (and resolution metadata) if the actor may edit"""
+        values = {'status': status}
         if status == Status.DONE:
             # Set resolution fields when closing
             if resolution:
-                ticket.resolution = resolution
-            ticket.resolved_at = datetime.now(timezone.utc)
+                values['resolution'] = resolution
+            values['resolved_at'] = datetime.now(timezone.utc)
         else:
             # Reopening or moving out of DONE clears resolution metadata
-            ticket.resolution = None
-            ticket.resolved_at = None
-        
-        return await self._update(ticket)
-    
-    async def assign_ticket(self, ticket_id: UUID, assignee_id: UUID) -> Ticket:
-        """Assign ticket to a user"""
-        ticket = await self._get(ticket_id)
-        if not ticket:
-            raise ValueError("Ticket not found")
-        
-        ticket.assignee_id = assignee_id
-        return await self._update(ticket)
+            values['resolution'] = None
+            values['resolved_at'] = None
+        return await self._guarded_update(
+            ticket_id, self._actor_can_edit(actor_id), values
+        )
+
+    async def assign_ticket_if_permitted(
+        self, ticket_id: UUID, actor_id: UUID, assignee_id: UUID
+    ) -> Optional[Ticket]:
+        """Assign the ticket if actor and assignee are project members"""
+        return await self._guarded_update(
+            ticket_id,
+            and_(
+                self._is_project_member(actor_id),
+                self._is_project_member(assignee_id)
+            ),
+            {'assignee_id': assignee_id}
+        )
     
     async def delete_ticket(self, ticket_id: UUID) -> bool:
         """Delete a ticket permanently"""
         ticket = await self._get(ticket_id)
         if not ticket:
             raise ValueError("Ticket not found")
-        
+
         await self.session.delete(ticket)
+        invalidate_ticket(ticket_id)
         return True
\ No newline at end of file
@@ -6,6 +6,7 @@ from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.utils.access_token import get_password_hash, verify_password
 from app.services.base import BaseService
+from app.core.cache import cache_delete
 
 
 class UserService(BaseService):
@@ -91,8 +92,10 @@ class UserService(BaseService):
         for field, value in update_dict.items():
             if value is not None:
                 setattr(user, field, value)
-        
-        return await self._update(user)
+
+        user = await self._update(user)
+        await cache_delete(f"user:{user_id}")
+        return user
     
     async def toggle_user_active(self, user_id: UUID, is_active: bool) -> Optional[User]:
         """Toggle user active status (admin only)"""
@@ -101,7 +104,9 @@ class UserService(BaseService):
             raise ValueError(f"User '{user_id}' not found")
         
         user.is_active = is_active
-        return await self._update(user)
+        user = await self._update(user)
+        await cache_delete(f"user:{user_id}")
+        return user
     
     async def delete_user(self, user_id: UUID) -> bool:
         """Delete a user (admin only)"""
@@ -110,6 +115,7 @@ class UserService(BaseService):
             raise ValueError(f"User '{user_id}' not found")
         
         await self._delete(user)
+        await cache_delete(f"user:{user_id}")
         return True
     
     async def count_users(self) -> int:
@@ -1,22 +1,72 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
 import bcrypt
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# argon2id hasher for new passwords; bcrypt is kept for verifying
+# hashes created before the switch
+_password_hasher = PasswordHasher()
+
+# Dedicated pool so CPU-heavy hashing never blocks the event loop or
+# competes with Starlette's shared threadpool
+_hash_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pwhash")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash"""
+    """Verify a password against a hash (argon2id or legacy bcrypt)"""
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except VerificationError:
+            return False
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt"""
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    """Hash a password using argon2id"""
+    return _password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the dedicated hashing thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the dedicated hashing thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, get_password_hash, password)
+
+
+# Computed once; the default token lifetime never changes at runtime
+_ACCESS_TOKEN_LIFETIME = timedelta(minutes=settings.access_token_expire_minutes)
+
+
+def create_user_token(user_id: str, email: str) -> str:
+    """Create a JWT for the fixed login/register claim shape.
+
+    Skips the dict copy/update dance in create_access_token: the claim
+    set is built literally and the expiry delta is precomputed.
+    """
+    return jwt.encode(
+        {
+            "id": user_id,
+            "email": email,
+            "exp": datetime.now(timezone.utc) + _ACCESS_TOKEN_LIFETIME,
+        },
+        settings.secret_key,
+        algorithm=settings.algorithm,
+    )
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -3,6 +3,7 @@ Common router utilities and helpers for clean, reusable endpoint logic
 """
 from typing import Optional, Tuple
 from uuid import UUID
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +12,13 @@ from app.models.project import Project
 from app.models.user import User
 from app.services.project_service import ProjectService
 
+# Process-wide memo for the hot by-name project lookup every ticket
+# route performs. Only found projects are cached, and callers read
+# plain columns off the detached row (relationships are noload), so a
+# hit skips the SELECT entirely. Renames leave the old name resolvable
+# for at most the TTL — same staleness window the role cache accepts.
+_project_by_name: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
 
 class PermissionChecker:
     """Handle permission checking for ticket and project operations"""
@@ -101,7 +109,15 @@ class PermissionChecker:
         return user
     
     async def get_project_by_name(self, project_name: str) -> Project:
-        """Get project by name, raises HTTPException if not found"""
+        """Get project by name, raises HTTPException if not found.
+
+        Answers from the process-wide TTL memo when possible; misses
+        (including not-found) always hit the database, so a freshly
+        created project resolves immediately.
+        """
+        project = _project_by_name.get(project_name)
+        if project is not None:
+            return project
         result = await self.db.execute(
             select(Project).where(Project.name == project_name)
         )
@@ -111,6 +127,7 @@ class PermissionChecker:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project '{project_name}' not found"
             )
+        _project_by_name[project_name] = project
         return project
     
     async def get_project_by_id(self, project_id: UUID) -> Project:
@@ -0,0 +1,32 @@
+"""
+In-process TTL cache for ticket existence checks.
+
+Hot tickets are probed on every comment/attachment request (dashboard
+polling hits the same ids hundreds of times a minute), and "does this
+ticket exist" is a near-terminal fact: ids are random UUIDs, so a ticket
+cannot spring into existence under a cached False, and a deleted ticket
+is evicted explicitly. A 30-second TTL bounds staleness either way.
+"""
+from uuid import UUID
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ticket import Ticket
+
+_ticket_exists_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+async def ticket_exists(ticket_id: UUID, db: AsyncSession) -> bool:
+    """Check ticket existence, serving repeats from the TTL cache"""
+    cached = _ticket_exists_cache.get(ticket_id)
+    if cached is not None:
+        return cached
+
+    exists = await db.get(Ticket, ticket_id) is not None
+    _ticket_exists_cache[ticket_id] = exists
+    return exists
+
+
+def invalidate_ticket(ticket_id: UUID) -> None:
+    """Drop a ticket from the existence cache (call on delete)"""
+    _ticket_exists_cache.pop(ticket_id, None)
@@ -8,4 +8,6 @@ from app.main import app
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # uvloop + httptools match the production CMD in the Dockerfile
+    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True,
+                loop="uvloop", http="httptools")
\ No newline at end of file